@@ -21,6 +21,7 @@ from src.animation.base import (
     get_neutral_blendshapes,
 )
 from src.animation.yield_controller import (
+    LastFrame,
     YieldController,
     YieldState,
     create_yield_controller,
@@ -50,6 +51,7 @@ __all__ = [
     "MockAnimationEngine",
     "get_neutral_blendshapes",
     # Yield
+    "LastFrame",
     "YieldController",
     "YieldState",
     "create_yield_controller",
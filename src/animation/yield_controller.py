@@ -4,7 +4,7 @@ TMF v3.0 §1.2, §4.3: If animation lag > 120ms, yield frames.
 Audio continuity ALWAYS wins - animation can be degraded.
 
 Yield Behavior:
-1. Lag > 120ms: Start yielding (skip frames)
+1. Lag > 120ms: Start yielding (skip frames); stop once lag <= 84ms
 2. Hold last valid blendshape pose
 3. If yield persists > 100ms: Begin slow-freeze
 4. Slow-freeze: Ease to neutral over exactly 150ms
@@ -16,24 +16,59 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
-from typing import Callable
+from types import MappingProxyType
+from typing import Callable, Mapping
+
+import numpy as np
 
 from src.audio.transport.audio_clock import get_audio_clock
 from src.config.constants import TMF
 from src.observability.logging import AnimationLogger
 from src.observability.metrics import record_animation_yield
 
+# Adaptive threshold (target_latency_ms mode): smoothing factor for the lag
+# EMA, how much of the smoothed lag's overshoot past the target is taken off
+# the threshold, and the floor
+LAG_EMA_ALPHA = 0.1
+ADAPTIVE_OVERSHOOT_RATIO = 0.5
+MIN_ADAPTIVE_THRESHOLD_MS = 40
+
+# Hysteresis: once yielding, keep yielding until lag falls to this fraction
+# of the threshold, so lag hovering near it does not flap on and off
+YIELD_EXIT_RATIO = 0.7
+
+# Freeze progress is quantized to 8 bits (0..255); the level both indexes
+# the ease-out table and keys the interpolated pose cache
+FREEZE_PROGRESS_LEVELS = 255
+
+# Ease-out curve 1 - (1 - t)^2 at each progress level; endpoints are exact
+_EASE_OUT_LUT: tuple[float, ...] = tuple(
+    (1.0 - (1.0 - np.linspace(0.0, 1.0, FREEZE_PROGRESS_LEVELS + 1)) ** 2).tolist()
+)
+
+
+def _noop() -> None:
+    """Default callback."""
+
 
-@dataclass
+@dataclass(slots=True)
+class LastFrame:
+    """Last successfully generated frame, updated in place on each record."""
+
+    blendshapes: dict
+    t_ms: int
+
+
+@dataclass(slots=True)
 class YieldState:
-    """Current yield state."""
+    """Current yield state (slotted; read on every animation frame)."""
 
     is_yielding: bool = False
     yield_start_ms: int = 0
     frames_skipped: int = 0
     in_slow_freeze: bool = False
     freeze_progress: float = 0.0  # 0.0 to 1.0
-    last_valid_frame: dict | None = None
+    last_valid_frame: LastFrame | None = None
 
 
 class YieldController:
@@ -41,6 +76,7 @@ class YieldController:
 
     Monitors lag and triggers yield behavior per TMF §4.3:
     - Lag > 120ms: Start skipping frames
+    - Lag back at or below 70% of that: Stop skipping (hysteresis)
     - Hold last pose
     - After 100ms: Begin slow-freeze to neutral
 
@@ -62,19 +98,53 @@ class YieldController:
         yield_threshold_ms: int = TMF.ANIMATION_YIELD_THRESHOLD_MS,
         freeze_trigger_ms: int = TMF.ANIMATION_FREEZE_THRESHOLD_MS,
         freeze_duration_ms: int = TMF.ANIMATION_FREEZE_DURATION_MS,
+        target_latency_ms: int | None = None,
     ) -> None:
+        """Initialize yield controller.
+
+        Args:
+            session_id: Session identifier
+            yield_threshold_ms: Lag above which frames are skipped
+            freeze_trigger_ms: Yield duration before slow-freeze starts
+            freeze_duration_ms: Duration of the ease to neutral
+            target_latency_ms: If set, adapt the threshold to keep lag under
+                this target instead of using yield_threshold_ms. While the
+                smoothed lag stays under the target the threshold sits at
+                the target, so steady lag below it never yields; sustained
+                overshoot lowers it (to MIN_ADAPTIVE_THRESHOLD_MS at most) so
+                yields start earlier and last longer. API-only: no setting
+                feeds it, callers opt in explicitly.
+        """
         self._session_id = session_id
-        self._yield_threshold_ms = yield_threshold_ms
+        self._target_latency_ms = target_latency_ms
+        self._ema_lag_ms = 0.0
+        self._yield_threshold_ms = (
+            yield_threshold_ms if target_latency_ms is None else target_latency_ms
+        )
+        self._yield_exit_threshold_ms = self._yield_threshold_ms * YIELD_EXIT_RATIO
         self._freeze_trigger_ms = freeze_trigger_ms
         self._freeze_duration_ms = freeze_duration_ms
 
         self._state = YieldState()
         self._logger = AnimationLogger(session_id)
-        self._neutral_pose: dict | None = None
-
-        # Callbacks
-        self._on_yield_start: Callable[[], None] | None = None
-        self._on_slow_freeze: Callable[[], None] | None = None
+        # Read-only view, so it can be handed out without defensive copies
+        self._neutral_pose: Mapping[str, float] | None = None
+        # Plain-dict neutral returned from yield frames, built once per pose
+        self._neutral_out: dict | None = None
+
+        # Structure-of-arrays view of the poses so the freeze lerp runs as
+        # whole-vector NumPy ops instead of a per-blendshape Python loop
+        self._keys: tuple[str, ...] = ()
+        self._neutral_vec: np.ndarray | None = None
+        self._last_vec: np.ndarray | None = None  # Built on first freeze frame
+        self._delta_vec: np.ndarray | None = None  # neutral - last
+        # (progress level, pose) of the last freeze frame; a fully frozen
+        # face keeps hitting the same level and reuses the pose as-is
+        self._pose_cache: tuple[int, dict] | None = None
+
+        # Callbacks (no-op until registered, so they are called unconditionally)
+        self._on_yield_start: Callable[[], None] = _noop
+        self._on_slow_freeze: Callable[[], None] = _noop
 
     def should_yield(self, lag_ms: int) -> bool:
         """Check if should yield based on lag.
@@ -85,14 +155,27 @@ class YieldController:
         Returns:
             True if frames should be skipped
         """
-        if lag_ms > self._yield_threshold_ms:
-            if not self._state.is_yielding:
-                self._start_yield()
-            return True
-
-        if self._state.is_yielding:
-            self._end_yield()
-        return False
+        if self._target_latency_ms is not None:
+            self._adapt_threshold(lag_ms)
+
+        threshold = (
+            self._yield_exit_threshold_ms if self._state.is_yielding else self._yield_threshold_ms
+        )
+        yielding = lag_ms > threshold
+        if yielding != self._state.is_yielding:
+            # Only edges do work; steady-state frames are a single compare
+            (self._end_yield, self._start_yield)[yielding]()
+        return yielding
+
+    def _adapt_threshold(self, lag_ms: int) -> None:
+        """Lower the yield threshold by the smoothed lag's overshoot of the target."""
+        self._ema_lag_ms += LAG_EMA_ALPHA * (lag_ms - self._ema_lag_ms)
+        overshoot = max(0.0, self._ema_lag_ms - self._target_latency_ms)
+        self._yield_threshold_ms = max(
+            MIN_ADAPTIVE_THRESHOLD_MS,
+            self._target_latency_ms - ADAPTIVE_OVERSHOOT_RATIO * overshoot,
+        )
+        self._yield_exit_threshold_ms = self._yield_threshold_ms * YIELD_EXIT_RATIO
 
     def _start_yield(self) -> None:
         """Start yielding frames."""
@@ -104,8 +187,7 @@ class YieldController:
         self._logger.yield_triggered(self._yield_threshold_ms)
         record_animation_yield()
 
-        if self._on_yield_start:
-            self._on_yield_start()
+        self._on_yield_start()
 
     def _end_yield(self) -> None:
         """End yield period."""
@@ -120,10 +202,15 @@ class YieldController:
             blendshapes: The blendshape values
             t_ms: Timestamp of the frame
         """
-        self._state.last_valid_frame = {
-            "blendshapes": blendshapes.copy(),
-            "t_ms": t_ms,
-        }
+        frame = self._state.last_valid_frame
+        if frame is None:
+            self._state.last_valid_frame = LastFrame(blendshapes.copy(), t_ms)
+        else:
+            # Reuse the holder instead of allocating a wrapper per frame
+            frame.blendshapes = blendshapes.copy()
+            frame.t_ms = t_ms
+        self._last_vec = None
+        self._pose_cache = None
 
     def get_yield_pose(self, t_ms: int) -> dict:
         """Get pose to use during yield.
@@ -136,7 +223,9 @@ class YieldController:
             t_ms: Current timestamp
 
         Returns:
-            Blendshape dict to use
+            Blendshape dict to use. It is shared with the controller (held
+            frame, neutral pose or cached freeze pose) rather than allocated
+            per call, so callers must treat it as read-only.
         """
         self._state.frames_skipped += 1
 
@@ -147,9 +236,7 @@ class YieldController:
         if yield_duration >= self._freeze_trigger_ms and not self._state.in_slow_freeze:
             self._state.in_slow_freeze = True
             self._logger.slow_freeze_started(t_ms)
-
-            if self._on_slow_freeze:
-                self._on_slow_freeze()
+            self._on_slow_freeze()
 
         if self._state.in_slow_freeze:
             # Calculate freeze progress (0.0 to 1.0)
@@ -163,8 +250,8 @@ class YieldController:
             return self._interpolate_to_neutral(self._state.freeze_progress)
 
         # Not yet freezing: hold last pose
-        if self._state.last_valid_frame:
-            return self._state.last_valid_frame["blendshapes"]
+        if self._state.last_valid_frame is not None:
+            return self._state.last_valid_frame.blendshapes
 
         # No last frame: return neutral
         return self._get_neutral()
@@ -178,32 +265,52 @@ class YieldController:
             progress: 0.0 (start) to 1.0 (fully neutral)
 
         Returns:
-            Interpolated blendshape dict
+            Interpolated blendshape dict. Frames whose progress falls in the
+            same 8-bit progress level share one dict, so callers must not
+            mutate it.
         """
-        # Ease-out curve: 1 - (1 - t)^2
-        eased = 1.0 - (1.0 - progress) ** 2
-
-        neutral = self._get_neutral()
-
-        if not self._state.last_valid_frame:
-            return neutral
-
-        last_pose = self._state.last_valid_frame["blendshapes"]
-        result = {}
-
-        for key in neutral:
-            start_val = last_pose.get(key, 0.0)
-            end_val = neutral[key]
-            result[key] = start_val + (end_val - start_val) * eased
+        level = min(FREEZE_PROGRESS_LEVELS, max(0, int(progress * FREEZE_PROGRESS_LEVELS + 0.5)))
+        cached = self._pose_cache
+        if cached is not None and cached[0] == level:
+            return cached[1]
 
-        return result
-
-    def _get_neutral(self) -> dict:
-        """Get neutral pose."""
+        if self._state.last_valid_frame is None:
+            pose = self._get_neutral()
+        else:
+            if self._last_vec is None:
+                self._load_last_vec()
+
+            # Ease-out curve: 1 - (1 - t)^2, from the precomputed table
+            eased = _EASE_OUT_LUT[level]
+
+            # last + (neutral - last) * eased, over every blendshape at once
+            values = self._last_vec + self._delta_vec * eased
+            pose = dict(zip(self._keys, values.tolist(), strict=True))
+
+        self._pose_cache = (level, pose)
+        return pose
+
+    def _load_last_vec(self) -> None:
+        """Lay out the last valid pose in neutral key order (missing keys are 0.0)."""
+        self._ensure_neutral()
+        get = self._state.last_valid_frame.blendshapes.get
+        self._last_vec = np.fromiter(
+            (get(key, 0.0) for key in self._keys),
+            dtype=np.float64,
+            count=len(self._keys),
+        )
+        self._delta_vec = self._neutral_vec - self._last_vec
+
+    def _ensure_neutral(self) -> None:
+        """Load the default neutral pose on first use."""
         if self._neutral_pose is None:
             from src.animation.base import get_neutral_blendshapes
-            self._neutral_pose = get_neutral_blendshapes()
-        return self._neutral_pose.copy()
+            self.set_neutral_pose(get_neutral_blendshapes())
+
+    def _get_neutral(self) -> dict:
+        """Get the shared neutral pose dict (do not mutate)."""
+        self._ensure_neutral()
+        return self._neutral_out
 
     def set_neutral_pose(self, pose: dict) -> None:
         """Set custom neutral pose.
@@ -211,7 +318,14 @@ class YieldController:
         Args:
             pose: Blendshape dict to use as neutral
         """
-        self._neutral_pose = pose.copy()
+        self._neutral_pose = MappingProxyType(dict(pose))
+        self._neutral_out = dict(pose)
+        self._keys = tuple(self._neutral_pose)
+        self._neutral_vec = np.fromiter(
+            self._neutral_pose.values(), dtype=np.float64, count=len(self._keys)
+        )
+        self._last_vec = None
+        self._pose_cache = None
 
     def on_yield_start(self, callback: Callable[[], None]) -> None:
         """Register callback for yield start."""
@@ -224,12 +338,20 @@ class YieldController:
     def reset(self) -> None:
         """Reset yield state."""
         self._state = YieldState()
+        self._last_vec = None
+        self._pose_cache = None
 
     @property
     def state(self) -> YieldState:
         """Current yield state."""
         return self._state
 
+    @property
+    def neutral_pose(self) -> Mapping[str, float]:
+        """Neutral pose as a read-only mapping (not copied)."""
+        self._ensure_neutral()
+        return self._neutral_pose
+
     @property
     def is_yielding(self) -> bool:
         """Whether currently yielding."""
@@ -246,13 +368,17 @@ class YieldController:
         return self._state.frames_skipped
 
 
-def create_yield_controller(session_id: str) -> YieldController:
+def create_yield_controller(
+    session_id: str,
+    target_latency_ms: int | None = None,
+) -> YieldController:
     """Factory function to create yield controller.
 
     Args:
         session_id: Session identifier
+        target_latency_ms: Opt into the adaptive threshold (see YieldController)
 
     Returns:
         Configured YieldController
     """
-    return YieldController(session_id)
+    return YieldController(session_id, target_latency_ms=target_latency_ms)
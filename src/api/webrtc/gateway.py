@@ -12,10 +12,14 @@ Reference: TMF v3.0 §3.7, Implementation §4.4
 from __future__ import annotations
 
 import asyncio
-import json
-from dataclasses import dataclass, field
+import inspect
+import weakref
+from collections import deque
+from dataclasses import dataclass
 from typing import Any, Callable
 
+import numpy as np
+import orjson
 from aiortc import (
     MediaStreamTrack,
     RTCConfiguration,
@@ -34,23 +38,46 @@ from src.observability.logging import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+# Frame slots in the AudioTrackSink receive ring. A view passed to on_audio
+# stays valid until the ring wraps, i.e. for this many subsequent frames.
+AUDIO_RING_SLOTS = 8
+
+# Frames buffered between receive and on_audio; the oldest are dropped when
+# the callback falls behind, bounding added latency to this many frames.
+AUDIO_QUEUE_FRAMES = 8
+
+
+def _encode(payload: dict) -> str:
+    """Encode a data channel payload as JSON text.
+
+    Decoded to str so the data channel sends a text message; bytes would
+    go out as a binary message, which clients do not expect.
+    """
+    return orjson.dumps(payload).decode()
+
+
+@dataclass(frozen=True, slots=True)
 class WebRTCConfig:
-    """Configuration for WebRTC connections."""
+    """Configuration for WebRTC connections (immutable, so instances can be shared)."""
 
-    stun_servers: list[str] = field(default_factory=lambda: [
+    stun_servers: tuple[str, ...] = (
         "stun:stun.l.google.com:19302",
         "stun:stun1.l.google.com:19302",
-    ])
-    turn_servers: list[dict] = field(default_factory=list)
+    )
+    turn_servers: tuple[dict, ...] = ()
     enable_data_channel: bool = True
     data_channel_ordered: bool = False  # UDP-like for animation
     data_channel_max_retransmits: int = 0  # Don't retransmit
     audio_sample_rate: int = 16000
     audio_channels: int = 1
+    # Blendshape frames aggregated per data channel message (1 = send immediately)
+    blendshape_batch_size: int = 1
+    blendshape_flush_ms: float = 8.0  # Max time a partial batch waits
+    # Skip frames while this much data is still queued on the data channel
+    max_buffered_bytes: int = 65536
 
 
-@dataclass
+@dataclass(slots=True)
 class PeerConnectionState:
     """State of a peer connection."""
 
@@ -66,44 +93,136 @@ class AudioTrackSink:
     """Sink for incoming audio from WebRTC.
 
     Receives audio frames and forwards to VAD/ASR pipeline.
+
+    Samples are copied once into a preallocated ring of frame slots and
+    handed to the callback as a memoryview of that slot instead of a fresh
+    bytes object. The decoded frame array and small view objects are still
+    created per frame; what is saved is the per-frame payload buffer.
+
+    on_audio receives a borrowed memoryview, not owned bytes: the slot is
+    overwritten AUDIO_RING_SLOTS frames later, so callbacks that keep audio
+    past that point must copy it (e.g. bytes(view)).
+
+    Frames pass through a bounded drop-oldest queue, so a slow callback
+    skips stale audio instead of falling further and further behind.
     """
 
     def __init__(
         self,
         session_id: str,
-        on_audio: Callable[[bytes, int], None],
+        on_audio: Callable[[memoryview, int], Any],
+        ring_slots: int = AUDIO_RING_SLOTS,
+        max_queue: int = AUDIO_QUEUE_FRAMES,
     ) -> None:
         self._session_id = session_id
         self._on_audio = on_audio
         self._running = False
 
+        # Ring buffer, sized on the first frame (and grown for larger frames).
+        # Extra slots cover frames still waiting in the queue.
+        self._ring_slots = ring_slots + max_queue
+        self._ring = memoryview(bytearray())
+        self._slot_bytes = 0
+        self._write_idx = 0
+
+        # Receive -> callback hand-off
+        self._queue: deque[tuple[memoryview, int]] = deque(maxlen=max_queue)
+        self._frames_ready = asyncio.Event()
+        self._receiving = False
+        self._frames_dropped = 0
+
+    def _write_frame(self, samples: np.ndarray) -> memoryview:
+        """Copy frame samples into the next ring slot.
+
+        Args:
+            samples: Frame samples as returned by frame.to_ndarray()
+
+        Returns:
+            View of the ring slot holding the samples
+        """
+        data = memoryview(np.ascontiguousarray(samples)).cast("B")
+        n = data.nbytes
+
+        if n > self._slot_bytes:
+            self._slot_bytes = n
+            self._ring = memoryview(bytearray(self._ring_slots * n))
+            self._write_idx = 0
+
+        offset = self._write_idx * self._slot_bytes
+        self._ring[offset:offset + n] = data
+        self._write_idx = (self._write_idx + 1) % self._ring_slots
+        return self._ring[offset:offset + n]
+
     async def start(self, track: MediaStreamTrack) -> None:
         """Start receiving audio from track.
 
+        Returns once the track ends (or stop() is called) and any queued
+        frames have been delivered.
+
         Args:
             track: WebRTC audio track
         """
         self._running = True
+        self._receiving = True
+        deliver_task = asyncio.create_task(self._deliver())
 
-        while self._running:
-            try:
-                frame = await track.recv()
-
-                # Extract audio bytes and timestamp
-                # aiortc frames are av.AudioFrame objects
-                audio_bytes = frame.to_ndarray().tobytes()
-                timestamp_ms = int(frame.pts * 1000 / frame.sample_rate)
-
-                self._on_audio(audio_bytes, timestamp_ms)
+        try:
+            while self._running:
+                try:
+                    frame = await track.recv()
+
+                    # Extract audio samples and timestamp
+                    # aiortc frames are av.AudioFrame objects
+                    audio = self._write_frame(frame.to_ndarray())
+                    timestamp_ms = int(frame.pts * 1000 / frame.sample_rate)
+
+                    if len(self._queue) == self._queue.maxlen:
+                        self._frames_dropped += 1
+                    self._queue.append((audio, timestamp_ms))
+                    self._frames_ready.set()
+
+                except Exception as e:
+                    if self._running:
+                        logger.error(
+                            "audio_receive_error",
+                            session_id=self._session_id,
+                            error=str(e),
+                        )
+                    break
+        finally:
+            self._receiving = False
+            self._frames_ready.set()
+            await deliver_task
+
+        if self._frames_dropped:
+            logger.warning(
+                "audio_frames_dropped",
+                session_id=self._session_id,
+                dropped=self._frames_dropped,
+            )
 
-            except Exception as e:
-                if self._running:
-                    logger.error(
-                        "audio_receive_error",
+    async def _deliver(self) -> None:
+        """Drain queued frames into the callback until receiving ends."""
+        while True:
+            await self._frames_ready.wait()
+            self._frames_ready.clear()
+
+            while self._queue:
+                audio, timestamp_ms = self._queue.popleft()
+                try:
+                    if inspect.iscoroutinefunction(self._on_audio):
+                        await self._on_audio(audio, timestamp_ms)
+                    else:
+                        self._on_audio(audio, timestamp_ms)
+                except Exception as e:
+                    logger.warning(
+                        "audio_callback_error",
                         session_id=self._session_id,
                         error=str(e),
                     )
-                break
+
+            if not self._receiving:
+                return
 
     def stop(self) -> None:
         """Stop receiving audio."""
@@ -135,20 +254,31 @@ class WebRTCGateway:
     """
 
     def __init__(self, config: WebRTCConfig | None = None) -> None:
-        if config is None:
-            settings = get_settings()
-            config = WebRTCConfig(
-                turn_servers=[{
-                    "urls": settings.turn_url,
-                    "username": settings.turn_username,
-                    "credential": settings.turn_credential,
-                }] if settings.turn_url else [],
-            )
-
-        self._config = config
+        self._config = config or _default_config()
         self._connections: dict[str, PeerConnectionState] = {}
-        self._audio_callbacks: dict[str, Callable[[bytes, int], None]] = {}
+        self._audio_callbacks: dict[str, Callable[[memoryview, int], None]] = {}
         self._relay = MediaRelay()
+        # Blendshape aggregation window, per session
+        self._pending_blendshapes: dict[str, list[dict]] = {}
+        self._flush_handles: dict[str, asyncio.TimerHandle] = {}
+        # ICE servers are fixed for the gateway's lifetime; build once, share per pc
+        self._rtc_configuration = self._create_rtc_config()
+        # Per-session negotiation locks, dropped when no longer in use
+        self._session_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+
+    def _lock_for(self, session_id: str) -> asyncio.Lock:
+        """Get the lock guarding a session's connection state.
+
+        Locks are held weakly, so they disappear once no coroutine is
+        using them and the table cannot grow with session churn.
+        """
+        lock = self._session_locks.get(session_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._session_locks[session_id] = lock
+        return lock
 
     def _create_rtc_config(self) -> RTCConfiguration:
         """Create RTCConfiguration with STUN/TURN servers."""
@@ -181,7 +311,7 @@ class WebRTCGateway:
             This is primarily for testing. In production, use handle_offer()
             which creates the peer connection as part of the SDP negotiation.
         """
-        pc = RTCPeerConnection(self._create_rtc_config())
+        pc = RTCPeerConnection(configuration=self._rtc_configuration)
         self._connections[session_id] = PeerConnectionState(
             session_id=session_id,
             pc=pc,
@@ -202,8 +332,22 @@ class WebRTCGateway:
         Returns:
             SDP answer string
         """
+        # Serialize negotiations for the same session
+        async with self._lock_for(session_id):
+            return await self._negotiate(session_id, offer_sdp)
+
+    async def _negotiate(self, session_id: str, offer_sdp: str) -> str:
+        """Create the peer connection and answer for an offer.
+
+        Must be called with the session lock held.
+        """
+        # A new offer replaces any previous connection for the session
+        previous = self._connections.pop(session_id, None)
+        if previous:
+            await previous.pc.close()
+
         # Create peer connection
-        pc = RTCPeerConnection(self._create_rtc_config())
+        pc = RTCPeerConnection(configuration=self._rtc_configuration)
 
         state = PeerConnectionState(session_id=session_id, pc=pc)
         self._connections[session_id] = state
@@ -270,6 +414,26 @@ class WebRTCGateway:
 
         return pc.localDescription.sdp
 
+    async def handle_offers_batch(
+        self,
+        offers: list[tuple[str, str]],
+    ) -> list[str | BaseException]:
+        """Handle SDP offers from several clients concurrently.
+
+        Each handshake awaits the peer connection several times; running
+        them together overlaps those waits across sessions.
+
+        Args:
+            offers: (session_id, offer_sdp) pairs
+
+        Returns:
+            SDP answer (or the raised exception) for each offer, in order
+        """
+        return await asyncio.gather(
+            *(self.handle_offer(session_id, sdp) for session_id, sdp in offers),
+            return_exceptions=True,
+        )
+
     async def handle_ice_candidate(
         self,
         session_id: str,
@@ -299,13 +463,15 @@ class WebRTCGateway:
     def on_audio(
         self,
         session_id: str,
-        callback: Callable[[bytes, int], None],
+        callback: Callable[[memoryview, int], None],
     ) -> None:
         """Register callback for incoming audio.
 
         Args:
             session_id: Session identifier
-            callback: Function to call with (audio_bytes, timestamp_ms)
+            callback: Function to call with (audio, timestamp_ms). audio is a
+                borrowed memoryview over AudioTrackSink's receive ring, valid
+                for AUDIO_RING_SLOTS frames; copy it (bytes(audio)) to keep it.
         """
         self._audio_callbacks[session_id] = callback
 
@@ -319,12 +485,16 @@ class WebRTCGateway:
         Uses WebRTC data channel (UDP-like) to avoid
         head-of-line blocking that affects WebSocket.
 
+        With blendshape_batch_size > 1, frames are aggregated and sent as
+        one {"batch": [...]} message once the batch fills or
+        blendshape_flush_ms elapses, whichever comes first.
+
         Args:
             session_id: Session identifier
             blendshapes: Blendshape frame dict per TMF schema
 
         Returns:
-            True if sent successfully
+            True if sent (or queued for the next batch) successfully
         """
         state = self._connections.get(session_id)
         if not state or not state.data_channel:
@@ -333,10 +503,66 @@ class WebRTCGateway:
         if state.data_channel.readyState != "open":
             return False
 
+        if self._config.blendshape_batch_size <= 1:
+            return self._send_data(session_id, state.data_channel, blendshapes)
+
+        pending = self._pending_blendshapes.setdefault(session_id, [])
+        pending.append(blendshapes)
+
+        if len(pending) >= self._config.blendshape_batch_size:
+            return self._flush_blendshapes(session_id)
+
+        if session_id not in self._flush_handles:
+            self._flush_handles[session_id] = asyncio.get_running_loop().call_later(
+                self._config.blendshape_flush_ms / 1000,
+                self._flush_blendshapes,
+                session_id,
+            )
+        return True
+
+    def _flush_blendshapes(self, session_id: str) -> bool:
+        """Send all pending blendshape frames for a session as one message.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            True if the batch was sent (or nothing was pending)
+        """
+        handle = self._flush_handles.pop(session_id, None)
+        if handle:
+            handle.cancel()
+
+        frames = self._pending_blendshapes.pop(session_id, None)
+        if not frames:
+            return True
+
+        state = self._connections.get(session_id)
+        if not state or not state.data_channel:
+            return False
+
+        if state.data_channel.readyState != "open":
+            return False
+
+        return self._send_data(session_id, state.data_channel, {"batch": frames})
+
+    def _send_data(
+        self,
+        session_id: str,
+        channel: RTCDataChannel,
+        payload: dict,
+    ) -> bool:
+        """Serialize and send a payload on a data channel.
+
+        Frames are dropped rather than queued while the channel's send
+        buffer is backed up; a stale animation frame is worthless and
+        queueing it only delays the fresh ones behind it.
+        """
+        if channel.bufferedAmount > self._config.max_buffered_bytes:
+            return False
+
         try:
-            # Serialize and send
-            data = json.dumps(blendshapes)
-            state.data_channel.send(data)
+            channel.send(_encode(payload))
             return True
         except Exception as e:
             logger.warning(
@@ -352,11 +578,17 @@ class WebRTCGateway:
         Args:
             session_id: Session identifier
         """
-        state = self._connections.pop(session_id, None)
-        if state:
-            await state.pc.close()
+        async with self._lock_for(session_id):
+            handle = self._flush_handles.pop(session_id, None)
+            if handle:
+                handle.cancel()
+            self._pending_blendshapes.pop(session_id, None)
 
-        self._audio_callbacks.pop(session_id, None)
+            state = self._connections.pop(session_id, None)
+            if state:
+                await state.pc.close()
+
+            self._audio_callbacks.pop(session_id, None)
 
         logger.info(
             "connection_closed",
@@ -364,9 +596,31 @@ class WebRTCGateway:
         )
 
     async def close_all(self) -> None:
-        """Close all peer connections."""
-        for session_id in list(self._connections.keys()):
-            await self.close_connection(session_id)
+        """Close all peer connections concurrently."""
+        states = list(self._connections.values())
+        self._connections.clear()
+        self._audio_callbacks.clear()
+        self._pending_blendshapes.clear()
+        for handle in self._flush_handles.values():
+            handle.cancel()
+        self._flush_handles.clear()
+
+        results = await asyncio.gather(
+            *(state.pc.close() for state in states),
+            return_exceptions=True,
+        )
+
+        for state, result in zip(states, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning(
+                    "connection_close_error",
+                    session_id=state.session_id,
+                    error=str(result),
+                )
+            logger.info(
+                "connection_closed",
+                session_id=state.session_id,
+            )
 
     def get_connection_state(self, session_id: str) -> str | None:
         """Get connection state for a session.
@@ -400,6 +654,23 @@ class WebRTCGateway:
         return len(self._connections)
 
 
+def _default_config() -> WebRTCConfig:
+    """Build the default gateway config, adding the TURN relay from settings.
+
+    STUN servers and data channel options keep their WebRTCConfig defaults;
+    only the TURN server is deployment-specific. Rebuilt per gateway from
+    the (already cached) get_settings(), so settings overrides apply.
+    """
+    settings = get_settings()
+    return WebRTCConfig(
+        turn_servers=({
+            "urls": settings.turn_url,
+            "username": settings.turn_username,
+            "credential": settings.turn_credential,
+        },) if settings.turn_url else (),
+    )
+
+
 # Factory function
 def create_webrtc_gateway(config: WebRTCConfig | None = None) -> WebRTCGateway:
     """Create WebRTC gateway instance.
@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
@@ -51,6 +52,20 @@ class SanitizationConfig:
     log_sanitization: bool = True
 
 
+def _freeze_whitelist(values: Iterable[str] | None) -> frozenset[str] | None:
+    """Coerce a whitelist to a frozenset for O(1) membership checks.
+
+    Empty or missing whitelists mean "allow all" and return None.
+    Frozensets are passed through unchanged, so callers that build their
+    whitelist once pay nothing per request.
+    """
+    if not values:
+        return None
+    if isinstance(values, frozenset):
+        return values
+    return frozenset(values)
+
+
 class TextSanitizationError(Exception):
     """Raised when text cannot be sanitized."""
 
@@ -205,13 +220,13 @@ def sanitize_prosody(
 
 def sanitize_voice_id(
     voice_id: str | None,
-    allowed_voices: list[str] | None = None,
+    allowed_voices: Iterable[str] | None = None,
 ) -> str | None:
     """Sanitize voice ID for TTS synthesis.
 
     Args:
         voice_id: Voice identifier
-        allowed_voices: Optional whitelist of allowed voice IDs
+        allowed_voices: Optional whitelist of allowed voice IDs (any iterable)
 
     Returns:
         Sanitized voice ID or None
@@ -243,7 +258,8 @@ def sanitize_voice_id(
         return None
 
     # Check whitelist if provided
-    if allowed_voices and sanitized not in allowed_voices:
+    allowed_voices = _freeze_whitelist(allowed_voices)
+    if allowed_voices is not None and sanitized not in allowed_voices:
         logger.warning(
             "tts_voice_id_not_allowed",
             voice_id=sanitized,
@@ -256,13 +272,13 @@ def sanitize_voice_id(
 
 def sanitize_language(
     language: str | None,
-    allowed_languages: list[str] | None = None,
+    allowed_languages: Iterable[str] | None = None,
 ) -> str | None:
     """Sanitize language code for TTS synthesis.
 
     Args:
         language: Language code (e.g., "en", "en-US")
-        allowed_languages: Optional whitelist of allowed language codes
+        allowed_languages: Optional whitelist of allowed language codes (any iterable)
 
     Returns:
         Sanitized language code or None
@@ -289,7 +305,8 @@ def sanitize_language(
         return None
 
     # Check whitelist if provided
-    if allowed_languages and language not in allowed_languages:
+    allowed_languages = _freeze_whitelist(allowed_languages)
+    if allowed_languages is not None and language not in allowed_languages:
         logger.warning(
             "tts_language_not_allowed",
             language=language,
@@ -306,8 +323,8 @@ def sanitize_tts_request(
     language: str | None = None,
     prosody: dict[str, Any] | None = None,
     config: SanitizationConfig | None = None,
-    allowed_voices: list[str] | None = None,
-    allowed_languages: list[str] | None = None,
+    allowed_voices: Iterable[str] | None = None,
+    allowed_languages: Iterable[str] | None = None,
 ) -> dict[str, Any]:
     """Sanitize all TTS request parameters.
 
@@ -319,8 +336,8 @@ def sanitize_tts_request(
         language: Language code
         prosody: Prosody parameters
         config: Sanitization configuration
-        allowed_voices: Whitelist of voice IDs
-        allowed_languages: Whitelist of language codes
+        allowed_voices: Whitelist of voice IDs (frozen once per call)
+        allowed_languages: Whitelist of language codes (frozen once per call)
 
     Returns:
         Dictionary with sanitized values
@@ -336,7 +353,7 @@ def sanitize_tts_request(
     """
     return {
         'text': sanitize_text(text, config),
-        'voice_id': sanitize_voice_id(voice_id, allowed_voices),
-        'language': sanitize_language(language, allowed_languages),
+        'voice_id': sanitize_voice_id(voice_id, _freeze_whitelist(allowed_voices)),
+        'language': sanitize_language(language, _freeze_whitelist(allowed_languages)),
         'prosody': sanitize_prosody(prosody, config),
     }
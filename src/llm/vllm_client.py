@@ -11,8 +11,11 @@ Reference: TMF v3.0 §3.2, Addendum A §A5
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import hashlib
+import io
 from dataclasses import dataclass, field
-from typing import AsyncIterator
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 import httpx
 from openai import AsyncOpenAI
@@ -22,10 +25,17 @@ from src.config.settings import get_settings
 from src.exceptions import LLMGenerationError
 from src.utils.async_timeout import AsyncTimeoutError, timeout_async_iterator
 
+# Connection pool for the vLLM endpoint. Keep-alive connections are reused
+# across requests so each generation skips the TCP (and TLS) handshake.
+# With HTTP/2 negotiated, concurrent streams share a single connection.
+HTTP_MAX_CONNECTIONS = 128
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 64
+HTTP_KEEPALIVE_EXPIRY_S = 30.0
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class LLMConfig:
-    """Configuration for vLLM client."""
+    """Configuration for vLLM client (immutable, so instances can be shared)."""
 
     base_url: str = "http://localhost:8000/v1"
     model: str = "mistral-7b-awq"
@@ -34,11 +44,14 @@ class LLMConfig:
     top_p: float = 0.95
     timeout_s: float = 30.0
     stream: bool = True
+    http2: bool = True  # Multiplex concurrent streams on one connection (TLS/ALPN)
+    # Send a per-system-prompt cache_salt (vLLM V1+ only; older servers reject it)
+    prefix_cache_salt: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LLMResponse:
-    """Response from LLM generation."""
+    """Response from LLM generation (immutable)."""
 
     text: str
     finish_reason: str | None = None
@@ -69,37 +82,47 @@ class VLLMClient:
     """
 
     def __init__(self, config: LLMConfig | None = None) -> None:
-        if config is None:
-            settings = get_settings()
-            config = LLMConfig(
-                base_url=settings.llm_base_url,
-                model=settings.llm_model_path.split("/")[-1],  # Extract model name
-            )
-
-        self._config = config
+        self._config = config or _default_config()
         self._client: AsyncOpenAI | None = None
-        self._current_task: asyncio.Task | None = None
-        self._abort_event: asyncio.Event = asyncio.Event()
+        self._http_client: httpx.AsyncClient | None = None
+        # Bound chat.completions.create, cached in start()
+        self._create: Callable[..., Awaitable[Any]] | None = None
+        # Abort handles for in-flight generate_stream calls
+        self._streams: set[_ActiveStream] = set()
         self._running: bool = False
         self._aborted: bool = False
 
     async def start(self) -> None:
         """Initialize vLLM client connection."""
+        self._http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_S,
+            ),
+            timeout=self._config.timeout_s,
+            http2=self._config.http2,
+        )
         self._client = AsyncOpenAI(
             base_url=self._config.base_url,
             api_key="EMPTY",  # vLLM doesn't require API key
             timeout=self._config.timeout_s,
+            http_client=self._http_client,
         )
+        self._create = self._client.chat.completions.create
         self._running = True
-        self._abort_event.clear()
         self._aborted = False
 
     async def stop(self) -> None:
         """Stop client and cleanup."""
         await self.abort()
+        self._create = None
         if self._client:
             await self._client.close()
             self._client = None
+        if self._http_client:
+            await self._http_client.aclose()
+            self._http_client = None
         self._running = False
 
     async def generate_stream(
@@ -125,7 +148,10 @@ class VLLMClient:
         if not self._running or not self._client:
             raise LLMGenerationError("Client not started", model=self._config.model)
 
-        self._abort_event.clear()
+        # Per-stream abort flag; abort() never cancels the consuming task
+        stream = _ActiveStream()
+        self._streams.add(stream)
+        self._aborted = False
 
         try:
             # Merge kwargs with defaults
@@ -138,8 +164,21 @@ class VLLMClient:
                 "stream": True,
             }
 
+            # Optionally partition the prefix cache per system prompt
+            extra_body = dict(kwargs.get("extra_body") or {})
+            if self._config.prefix_cache_salt:
+                salt = _prefix_cache_salt(messages)
+                if salt is not None:
+                    extra_body.setdefault("cache_salt", salt)
+            if extra_body:
+                params["extra_body"] = extra_body
+
             # Create streaming request
-            response = await self._client.chat.completions.create(**params)
+            stream.response = response = await self._create(**params)
+            if stream.aborted:
+                # abort() ran while the request was being sent
+                await _close_response(response)
+                return
 
             # Wrap streaming iteration with timeout
             async for chunk in timeout_async_iterator(
@@ -148,7 +187,7 @@ class VLLMClient:
                 operation="LLM streaming",
             ):
                 # Check for abort
-                if self._abort_event.is_set():
+                if stream.aborted:
                     break
 
                 yield chunk
@@ -159,12 +198,18 @@ class VLLMClient:
                 model=self._config.model,
             )
         except asyncio.CancelledError:
+            # Release the upstream response (and its connection) right away
+            if stream.response is not None:
+                await _close_response(stream.response)
             raise
         except LLMGenerationError:
             raise
         except Exception as e:
-            if not self._abort_event.is_set():
+            # Reads fail once abort() closes the response; that is not an error
+            if not stream.aborted:
                 raise LLMGenerationError(str(e), model=self._config.model)
+        finally:
+            self._streams.discard(stream)
 
     async def _iterate_response(self, response) -> AsyncIterator[str]:
         """Iterate over response chunks, extracting content.
@@ -176,8 +221,10 @@ class VLLMClient:
             Token strings from response chunks
         """
         async for chunk in response:
-            if chunk.choices and chunk.choices[0].delta.content:
-                yield chunk.choices[0].delta.content
+            # Single attribute walk per chunk; this loop runs once per token
+            choices = chunk.choices
+            if choices and (content := choices[0].delta.content):
+                yield content
 
     async def generate(
         self,
@@ -199,20 +246,24 @@ class VLLMClient:
         if not self._running or not self._client:
             raise LLMGenerationError("Client not started", model=self._config.model)
 
-        text_parts: list[str] = []
+        # Accumulate into one growing buffer rather than a list of token objects
+        buffer = io.StringIO()
 
         async for token in self.generate_stream(messages, **kwargs):
-            text_parts.append(token)
+            buffer.write(token)
 
         return LLMResponse(
-            text="".join(text_parts),
+            text=buffer.getvalue(),
             is_complete=True,
         )
 
     async def abort(self) -> None:
         """Abort current generation immediately.
 
-        Called on barge-in to stop LLM generation.
+        Called on barge-in to stop LLM generation. Flags every in-flight
+        stream and closes its upstream response, so consumers blocked on
+        the next token wake up and finish quietly. The consuming tasks
+        themselves are never cancelled.
         Must complete quickly to meet 150ms barge-in contract.
         Idempotent - safe to call multiple times.
         """
@@ -221,14 +272,15 @@ class VLLMClient:
             return
 
         self._aborted = True
-        self._abort_event.set()
 
-        if self._current_task and not self._current_task.done():
-            self._current_task.cancel()
-            try:
-                await asyncio.wait_for(self._current_task, timeout=0.1)
-            except (asyncio.CancelledError, asyncio.TimeoutError):
-                pass
+        responses = []
+        for stream in self._streams:
+            stream.aborted = True
+            if stream.response is not None:
+                responses.append(stream.response)
+
+        if responses:
+            await asyncio.gather(*(_close_response(r) for r in responses))
 
     @property
     def is_running(self) -> bool:
@@ -236,6 +288,46 @@ class VLLMClient:
         return self._running
 
 
+class _ActiveStream:
+    """Abort handle for one in-flight generate_stream call."""
+
+    __slots__ = ("aborted", "response")
+
+    def __init__(self) -> None:
+        self.aborted = False
+        self.response: Any = None
+
+
+async def _close_response(response: Any) -> None:
+    """Close an upstream streaming response, releasing its connection."""
+    with contextlib.suppress(Exception):
+        await response.aclose()
+
+
+def _default_config() -> LLMConfig:
+    """Build the default config from current settings."""
+    settings = get_settings()
+    return LLMConfig(
+        base_url=settings.llm_base_url,
+        model=settings.llm_model_path.split("/")[-1],  # Extract model name
+    )
+
+
+def _prefix_cache_salt(messages: list[dict[str, str]]) -> str | None:
+    """Derive a stable prefix-cache salt from the leading system prompt.
+
+    The salt only partitions vLLM's prefix cache: requests with different
+    salts never share KV blocks. It does not add cache reuse or routing
+    affinity, and servers without cache_salt support (e.g. vLLM V0) reject
+    the field with a 400, hence LLMConfig.prefix_cache_salt defaults to off.
+    Returns None when the conversation has no system prompt.
+    """
+    if not messages or messages[0].get("role") != "system":
+        return None
+    content = messages[0].get("content", "")
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=8).hexdigest()
+
+
 def build_messages(
     system_prompt: str,
     conversation: list[dict[str, str]],
@@ -249,12 +341,15 @@ def build_messages(
         user_input: Current user input
 
     Returns:
-        List of message dicts for LLM API
+        List of message dicts for LLM API. History dicts are shared by
+        reference, not copied.
     """
-    messages = [{"role": "system", "content": system_prompt}]
-    messages.extend(conversation)
-    messages.append({"role": "user", "content": user_input})
-    return messages
+    # Single sized allocation; avoids append-driven list regrowth on long histories
+    return [
+        {"role": "system", "content": system_prompt},
+        *conversation,
+        {"role": "user", "content": user_input},
+    ]
 
 
 async def create_vllm_client(**kwargs) -> VLLMClient:
@@ -20,7 +20,7 @@ import asyncio
 import inspect
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Callable
+from typing import Callable, ClassVar
 
 from src.audio.transport.audio_clock import get_audio_clock
 from src.audio.vad.silero_vad import VADEvent, VADState
@@ -74,6 +74,11 @@ class TurnDetector:
         await detector.handle_vad_event(vad_event)
     """
 
+    # States in which the agent holds the turn (hash lookup in is_agent_turn)
+    _AGENT_STATES: ClassVar[frozenset[TurnState]] = frozenset(
+        {TurnState.THINKING, TurnState.SPEAKING}
+    )
+
     session_id: str
     endpoint_budget_ms: int = TMF.TURN_ENDPOINT_BUDGET_MS
     hard_timeout_ms: int = TMF.TURN_HARD_TIMEOUT_MS
@@ -328,4 +333,4 @@ class TurnDetector:
     @property
     def is_agent_turn(self) -> bool:
         """Whether it's the agent's turn (THINKING or SPEAKING)."""
-        return self._state in (TurnState.THINKING, TurnState.SPEAKING)
+        return self._state in self._AGENT_STATES
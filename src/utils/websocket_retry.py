@@ -12,8 +12,9 @@ from __future__ import annotations
 
 import asyncio
 import inspect
-from dataclasses import dataclass
-from typing import Callable, TypeVar
+import random
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, TypeVar
 
 from src.observability.logging import get_logger
 
@@ -22,10 +23,13 @@ logger = get_logger(__name__)
 # Type for the connection result
 T = TypeVar("T")
 
+# Bound once; jitter is drawn on every retry
+_random = random.random
 
-@dataclass
+
+@dataclass(frozen=True)
 class RetryConfig:
-    """Configuration for retry behavior."""
+    """Configuration for retry behavior (immutable; the backoff schedule is precomputed)."""
 
     max_retries: int = 3
     initial_delay_s: float = 0.5
@@ -33,6 +37,17 @@ class RetryConfig:
     backoff_factor: float = 2.0
     jitter: bool = True
 
+    # Base delay before each retry, i.e. after attempts 1..max_retries-1
+    _delays: tuple[float, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        delays = []
+        delay = self.initial_delay_s
+        for _ in range(self.max_retries - 1):
+            delays.append(delay)
+            delay = min(delay * self.backoff_factor, self.max_delay_s)
+        object.__setattr__(self, "_delays", tuple(delays))
+
 
 class RetryExhausted(Exception):
     """All retry attempts failed."""
@@ -44,10 +59,13 @@ class RetryExhausted(Exception):
 
 
 async def with_retry(
-    connect_fn: Callable[[], T],
+    connect_fn: Callable[[], Awaitable[T]],
     config: RetryConfig | None = None,
     operation_name: str = "connect",
     session_id: str | None = None,
+    *,
+    sleep: Callable[[float], Awaitable[object]] = asyncio.sleep,
+    rng: random.Random | None = None,
 ) -> T:
     """Execute a connection function with exponential backoff retry.
 
@@ -56,6 +74,8 @@ async def with_retry(
         config: Retry configuration
         operation_name: Name for logging
         session_id: Session ID for logging
+        sleep: Awaitable used to wait out each backoff delay
+        rng: Random source for jitter (defaults to the module-level RNG)
 
     Returns:
         Result of connect_fn
@@ -74,10 +94,12 @@ async def with_retry(
     if config is None:
         config = RetryConfig()
 
-    delay = config.initial_delay_s
+    delays = config._delays
+    max_retries = config.max_retries
+    draw = _random if rng is None else rng.random
     last_error: Exception | None = None
 
-    for attempt in range(1, config.max_retries + 1):
+    for attempt in range(1, max_retries + 1):
         try:
             result = await connect_fn()
             if attempt > 1:
@@ -93,7 +115,7 @@ async def with_retry(
 
         except Exception as e:
             last_error = e
-            if attempt == config.max_retries:
+            if attempt == max_retries:
                 logger.error(
                     f"{operation_name}_retry_exhausted",
                     session_id=session_id,
@@ -102,28 +124,24 @@ async def with_retry(
                 )
                 raise RetryExhausted(attempt, e)
 
-            # Calculate delay with optional jitter
-            actual_delay = delay
+            # Precomputed backoff, with optional jitter
+            delay = delays[attempt - 1]
             if config.jitter:
-                import random
-                actual_delay = delay * (0.5 + random.random())
+                delay *= 0.5 + draw()
 
             logger.warning(
                 f"{operation_name}_retry",
                 session_id=session_id,
                 attempt=attempt,
-                max_retries=config.max_retries,
-                delay_s=actual_delay,
+                max_retries=max_retries,
+                delay_s=delay,
                 error=str(e),
             )
 
-            await asyncio.sleep(actual_delay)
-
-            # Increase delay for next attempt
-            delay = min(delay * config.backoff_factor, config.max_delay_s)
+            await sleep(delay)
 
     # Should never reach here
-    raise RetryExhausted(config.max_retries, last_error)
+    raise RetryExhausted(max_retries, last_error)
 
 
 class ReconnectingWebSocket:
@@ -173,6 +191,8 @@ class ReconnectingWebSocket:
         self._connection = None
         self._running = False
         self._monitor_task: asyncio.Task | None = None
+        # Set while a connection is established; lets waiters sleep instead of polling
+        self._connected_event = asyncio.Event()
 
     @property
     def connection(self):
@@ -184,6 +204,21 @@ class ReconnectingWebSocket:
         """Whether currently connected."""
         return self._connection is not None and self._running
 
+    async def wait_connected(self, timeout: float | None = None) -> bool:
+        """Wait until a connection is established.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if connected, False if the timeout expired first
+        """
+        try:
+            await asyncio.wait_for(self._connected_event.wait(), timeout)
+        except TimeoutError:
+            return False
+        return True
+
     async def start(self) -> None:
         """Start connection with retry."""
         self._running = True
@@ -194,6 +229,7 @@ class ReconnectingWebSocket:
             operation_name="websocket_connect",
             session_id=self._session_id,
         )
+        self._connected_event.set()
 
         if self._on_connect:
             try:
@@ -211,6 +247,7 @@ class ReconnectingWebSocket:
     async def stop(self) -> None:
         """Stop connection and monitoring."""
         self._running = False
+        self._connected_event.clear()
 
         if self._monitor_task:
             self._monitor_task.cancel()
@@ -249,6 +286,7 @@ class ReconnectingWebSocket:
             return False
 
         # Close existing connection
+        self._connected_event.clear()
         if self._connection:
             try:
                 await self._connection.close()
@@ -263,6 +301,7 @@ class ReconnectingWebSocket:
                 operation_name="websocket_reconnect",
                 session_id=self._session_id,
             )
+            self._connected_event.set()
 
             if self._on_connect:
                 try:
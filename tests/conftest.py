@@ -1,5 +1,6 @@
 """Pytest configuration and shared fixtures."""
 
+import asyncio
 import os
 from typing import Generator
 
@@ -20,6 +21,24 @@ os.environ.update({
 })
 
 
+# Modules whose async tests run on uvloop (lower per-task overhead) when it
+# is installed. Others keep the default loop: some rely on its cancellation
+# timing (e.g. blendshape WebSocket send loops left running at teardown).
+UVLOOP_TEST_MODULES = frozenset({"tests.test_websocket_retry"})
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Choose the event loop implementation for each async test."""
+    if item.module.__name__ in UVLOOP_TEST_MODULES:
+        try:
+            import uvloop
+        except ImportError:  # e.g. Windows, where uvloop is unavailable
+            pass
+        else:
+            return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
+
+
 @pytest.fixture
 def test_settings():
     """Provide test settings instance."""
@@ -285,7 +285,7 @@ class TestYieldController:
         controller.record_frame(blendshapes, 1000)
 
         assert controller.state.last_valid_frame is not None
-        assert controller.state.last_valid_frame["blendshapes"]["jawOpen"] == 0.5
+        assert controller.state.last_valid_frame.blendshapes["jawOpen"] == 0.5
 
     def test_get_yield_pose_returns_last_frame(self, controller, audio_clock):
         """Test yield pose returns last valid frame initially."""
@@ -265,6 +265,16 @@ class TestSanitizeVoiceId:
         result = sanitize_voice_id("voice3", allowed)
         assert result is None
 
+    def test_sanitize_voice_id_whitelist_accepts_any_iterable(self):
+        """Whitelist may be a tuple, set, or frozenset."""
+        for allowed in (("voice1",), {"voice1"}, frozenset({"voice1"})):
+            assert sanitize_voice_id("voice1", allowed) == "voice1"
+            assert sanitize_voice_id("voice2", allowed) is None
+
+    def test_sanitize_voice_id_empty_whitelist_allows_all(self):
+        """Empty whitelist is treated as no whitelist."""
+        assert sanitize_voice_id("voice1", []) == "voice1"
+
     def test_sanitize_voice_id_non_string_returns_none(self):
         """Non-string input returns None."""
         result = sanitize_voice_id(123)  # type: ignore
@@ -376,6 +386,16 @@ class TestSanitizeTTSRequest:
         assert result["voice_id"] is None
         assert result["language"] is None
 
+    def test_whitelist_frozenset(self):
+        """Whitelists become frozensets; frozensets pass through as-is."""
+        from src.audio.tts.sanitize import _freeze_whitelist
+
+        first = _freeze_whitelist(["voice2", "voice1"])
+
+        assert first == frozenset({"voice1", "voice2"})
+        assert _freeze_whitelist(first) is first
+        assert _freeze_whitelist(None) is None
+
 
 class TestSanitizationConfig:
     """Tests for SanitizationConfig dataclass."""
@@ -11,10 +11,11 @@ Tests cover:
 """
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
 
 import pytest
 
+from src.orchestrator import turn_detector as turn_detector_module
 from src.orchestrator.turn_detector import (
     TurnDetector,
     TurnEvent,
@@ -22,22 +23,79 @@ from src.orchestrator.turn_detector import (
 )
 from src.audio.vad.silero_vad import VADEvent, VADState
 
+_SID = "test-session"
+
+# Shared VAD events; TurnDetector only reads them, so one instance serves all tests.
+VAD_SPEECH_1000 = VADEvent(
+    state=VADState.SPEECH, t_ms=1000, probability=0.9, session_id=_SID
+)
+VAD_ENDPOINT_1000 = VADEvent(
+    state=VADState.ENDPOINT, t_ms=1000, probability=0.1, session_id=_SID
+)
+VAD_ENDPOINT_2000 = VADEvent(
+    state=VADState.ENDPOINT, t_ms=2000, probability=0.1, session_id=_SID
+)
+VAD_SPEECH_3000 = VADEvent(
+    state=VADState.SPEECH, t_ms=3000, probability=0.9, session_id=_SID
+)
+
+
+async def _drive_events(detector: TurnDetector, events) -> None:
+    """Feed VAD events to the detector strictly in order.
+
+    Transitions depend on the previous state, so events are awaited one
+    after another rather than gathered concurrently.
+    """
+    for event in events:
+        await detector.handle_vad_event(event)
+
+
+async def _drive_to(detector: TurnDetector, target: TurnState) -> None:
+    """Replay the minimal event sequence to move an idle detector to target."""
+    if target == TurnState.LISTENING:
+        await _drive_events(detector, (VAD_SPEECH_1000,))
+        return
+    await _drive_events(detector, (VAD_SPEECH_1000, VAD_ENDPOINT_2000))
+    if target == TurnState.SPEAKING:
+        await detector.start_speaking()
+    assert detector.state == target
+
+
+# Constant-valued stand-in for the audio clock (no call recording needed).
+_CLOCK = SimpleNamespace(
+    get_time_ms=lambda session_id: 1000,
+    get_reading=lambda session_id: SimpleNamespace(raw_ns=1_000_000_000),
+    measure_elapsed_ms=lambda start_ns: 5.0,
+)
+
+
+@pytest.fixture(scope="module")
+def mock_clock():
+    """Patch the audio clock once for the whole module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(turn_detector_module, "get_audio_clock", lambda: _CLOCK)
+        yield _CLOCK
+
+
+@pytest.fixture
+def detector(mock_clock):
+    """Create a fresh detector against the shared mocked clock."""
+    return TurnDetector(session_id=_SID)
+
 
 class TestTurnState:
     """Tests for TurnState enum."""
 
     def test_all_states_exist(self):
-        """All turn states exist."""
-        assert TurnState.IDLE.value == "idle"
-        assert TurnState.LISTENING.value == "listening"
-        assert TurnState.ENDPOINT_DETECTED.value == "endpoint_detected"
-        assert TurnState.THINKING.value == "thinking"
-        assert TurnState.SPEAKING.value == "speaking"
-        assert TurnState.INTERRUPTED.value == "interrupted"
-
-    def test_state_count(self):
-        """Correct number of states."""
-        assert len(TurnState) == 6
+        """All turn states exist with the expected values, and no others."""
+        assert {s.name: s.value for s in TurnState} == {
+            "IDLE": "idle",
+            "LISTENING": "listening",
+            "ENDPOINT_DETECTED": "endpoint_detected",
+            "THINKING": "thinking",
+            "SPEAKING": "speaking",
+            "INTERRUPTED": "interrupted",
+        }
 
 
 class TestTurnEvent:
@@ -49,12 +107,12 @@ class TestTurnEvent:
             old_state=TurnState.IDLE,
             new_state=TurnState.LISTENING,
             t_ms=1000,
-            session_id="test-session",
+            session_id=_SID,
         )
         assert event.old_state == TurnState.IDLE
         assert event.new_state == TurnState.LISTENING
         assert event.t_ms == 1000
-        assert event.session_id == "test-session"
+        assert event.session_id == _SID
         assert event.reason == ""
         assert event.latency_ms is None
 
@@ -64,7 +122,7 @@ class TestTurnEvent:
             old_state=TurnState.LISTENING,
             new_state=TurnState.THINKING,
             t_ms=2000,
-            session_id="test-session",
+            session_id=_SID,
             reason="vad_endpoint",
         )
         assert event.reason == "vad_endpoint"
@@ -75,7 +133,7 @@ class TestTurnEvent:
             old_state=TurnState.ENDPOINT_DETECTED,
             new_state=TurnState.THINKING,
             t_ms=3000,
-            session_id="test-session",
+            session_id=_SID,
             reason="endpoint_confirmed",
             latency_ms=12,
         )
@@ -87,8 +145,8 @@ class TestTurnDetectorInit:
 
     def test_default_init(self):
         """Test default initialization."""
-        detector = TurnDetector(session_id="test-session")
-        assert detector.session_id == "test-session"
+        detector = TurnDetector(session_id=_SID)
+        assert detector.session_id == _SID
         assert detector.state == TurnState.IDLE
         assert detector.ttfa_start_ms is None
         assert detector.is_user_turn is False
@@ -97,7 +155,7 @@ class TestTurnDetectorInit:
     def test_custom_budget(self):
         """Test custom endpoint budget."""
         detector = TurnDetector(
-            session_id="test-session",
+            session_id=_SID,
             endpoint_budget_ms=20,
             hard_timeout_ms=600,
         )
@@ -105,31 +163,15 @@ class TestTurnDetectorInit:
         assert detector.hard_timeout_ms == 600
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestTurnDetectorStateTransitions:
     """Tests for state transitions."""
 
-    @pytest.fixture
-    def detector(self):
-        """Create detector with mocked clock."""
-        with patch("src.orchestrator.turn_detector.get_audio_clock") as mock_clock:
-            mock_clock.return_value.get_time_ms.return_value = 1000
-            mock_clock.return_value.get_reading.return_value.raw_ns = 1000000000
-            mock_clock.return_value.measure_elapsed_ms.return_value = 5.0
-            detector = TurnDetector(session_id="test-session")
-            yield detector
-
-    @pytest.mark.asyncio
     async def test_idle_to_listening_on_speech(self, detector):
         """IDLE -> LISTENING on speech start."""
         assert detector.state == TurnState.IDLE
 
-        vad_event = VADEvent(
-            state=VADState.SPEECH,
-            t_ms=1000,
-            probability=0.9,
-            session_id="test-session",
-        )
-        turn_event = await detector.handle_vad_event(vad_event)
+        turn_event = await detector.handle_vad_event(VAD_SPEECH_1000)
 
         assert detector.state == TurnState.LISTENING
         assert turn_event is not None
@@ -137,43 +179,24 @@ class TestTurnDetectorStateTransitions:
         assert turn_event.new_state == TurnState.LISTENING
         assert turn_event.reason == "user_speech_start"
 
-    @pytest.mark.asyncio
     async def test_listening_to_thinking_on_endpoint(self, detector):
         """LISTENING -> ENDPOINT_DETECTED -> THINKING on speech end."""
         # First transition to LISTENING
-        vad_speech = VADEvent(
-            state=VADState.SPEECH,
-            t_ms=1000,
-            probability=0.9,
-            session_id="test-session",
-        )
-        await detector.handle_vad_event(vad_speech)
+        await detector.handle_vad_event(VAD_SPEECH_1000)
         assert detector.state == TurnState.LISTENING
 
         # Then endpoint detected
-        vad_endpoint = VADEvent(
-            state=VADState.ENDPOINT,
-            t_ms=2000,
-            probability=0.1,
-            session_id="test-session",
-        )
-        turn_event = await detector.handle_vad_event(vad_endpoint)
+        turn_event = await detector.handle_vad_event(VAD_ENDPOINT_2000)
 
         assert detector.state == TurnState.THINKING
         assert turn_event is not None
         assert turn_event.new_state == TurnState.THINKING
         assert turn_event.reason == "endpoint_confirmed"
 
-    @pytest.mark.asyncio
     async def test_thinking_to_speaking(self, detector):
         """THINKING -> SPEAKING on start_speaking."""
         # Setup: get to THINKING state
-        await detector.handle_vad_event(VADEvent(
-            state=VADState.SPEECH, t_ms=1000, probability=0.9, session_id="test-session"
-        ))
-        await detector.handle_vad_event(VADEvent(
-            state=VADState.ENDPOINT, t_ms=2000, probability=0.1, session_id="test-session"
-        ))
+        await _drive_to(detector, TurnState.THINKING)
         assert detector.state == TurnState.THINKING
 
         # Start speaking
@@ -184,17 +207,10 @@ class TestTurnDetectorStateTransitions:
         assert turn_event.new_state == TurnState.SPEAKING
         assert turn_event.reason == "agent_speaking"
 
-    @pytest.mark.asyncio
     async def test_speaking_to_listening_on_finish(self, detector):
         """SPEAKING -> LISTENING on finish_speaking."""
         # Setup: get to SPEAKING state
-        await detector.handle_vad_event(VADEvent(
-            state=VADState.SPEECH, t_ms=1000, probability=0.9, session_id="test-session"
-        ))
-        await detector.handle_vad_event(VADEvent(
-            state=VADState.ENDPOINT, t_ms=2000, probability=0.1, session_id="test-session"
-        ))
-        await detector.start_speaking()
+        await _drive_to(detector, TurnState.SPEAKING)
         assert detector.state == TurnState.SPEAKING
 
         # Finish speaking
@@ -206,47 +222,24 @@ class TestTurnDetectorStateTransitions:
         assert turn_event.reason == "agent_finished"
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestTurnDetectorBargeIn:
     """Tests for barge-in handling."""
 
-    @pytest.fixture
-    def detector(self):
-        """Create detector with mocked clock."""
-        with patch("src.orchestrator.turn_detector.get_audio_clock") as mock_clock:
-            mock_clock.return_value.get_time_ms.return_value = 1000
-            mock_clock.return_value.get_reading.return_value.raw_ns = 1000000000
-            mock_clock.return_value.measure_elapsed_ms.return_value = 5.0
-            detector = TurnDetector(session_id="test-session")
-            yield detector
-
-    @pytest.mark.asyncio
     async def test_barge_in_during_speaking(self, detector):
         """Barge-in when agent is speaking."""
         # Setup: get to SPEAKING state
-        await detector.handle_vad_event(VADEvent(
-            state=VADState.SPEECH, t_ms=1000, probability=0.9, session_id="test-session"
-        ))
-        await detector.handle_vad_event(VADEvent(
-            state=VADState.ENDPOINT, t_ms=2000, probability=0.1, session_id="test-session"
-        ))
-        await detector.start_speaking()
+        await _drive_to(detector, TurnState.SPEAKING)
         assert detector.state == TurnState.SPEAKING
 
         # User interrupts
-        vad_speech = VADEvent(
-            state=VADState.SPEECH,
-            t_ms=3000,
-            probability=0.9,
-            session_id="test-session",
-        )
-        turn_event = await detector.handle_vad_event(vad_speech)
+        turn_event = await detector.handle_vad_event(VAD_SPEECH_3000)
 
         # Should transition to LISTENING after interruption
         assert detector.state == TurnState.LISTENING
         assert turn_event is not None
         assert turn_event.reason == "barge_in_listening"
 
-    @pytest.mark.asyncio
     async def test_barge_in_callback_called(self, detector):
         """Barge-in callback is invoked."""
         barge_in_events = []
@@ -257,37 +250,19 @@ class TestTurnDetectorBargeIn:
         detector.on_barge_in(on_barge_in)
 
         # Setup: get to SPEAKING state
-        await detector.handle_vad_event(VADEvent(
-            state=VADState.SPEECH, t_ms=1000, probability=0.9, session_id="test-session"
-        ))
-        await detector.handle_vad_event(VADEvent(
-            state=VADState.ENDPOINT, t_ms=2000, probability=0.1, session_id="test-session"
-        ))
-        await detector.start_speaking()
+        await _drive_to(detector, TurnState.SPEAKING)
 
         # Trigger barge-in
-        await detector.handle_vad_event(VADEvent(
-            state=VADState.SPEECH, t_ms=3000, probability=0.9, session_id="test-session"
-        ))
+        await detector.handle_vad_event(VAD_SPEECH_3000)
 
         assert len(barge_in_events) == 1
         assert barge_in_events[0].reason == "user_barge_in"
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestTurnDetectorCallbacks:
     """Tests for callback system."""
 
-    @pytest.fixture
-    def detector(self):
-        """Create detector with mocked clock."""
-        with patch("src.orchestrator.turn_detector.get_audio_clock") as mock_clock:
-            mock_clock.return_value.get_time_ms.return_value = 1000
-            mock_clock.return_value.get_reading.return_value.raw_ns = 1000000000
-            mock_clock.return_value.measure_elapsed_ms.return_value = 5.0
-            detector = TurnDetector(session_id="test-session")
-            yield detector
-
-    @pytest.mark.asyncio
     async def test_endpoint_callback(self, detector):
         """Endpoint callback is invoked."""
         endpoint_events = []
@@ -298,17 +273,11 @@ class TestTurnDetectorCallbacks:
         detector.on_endpoint(on_endpoint)
 
         # Trigger endpoint
-        await detector.handle_vad_event(VADEvent(
-            state=VADState.SPEECH, t_ms=1000, probability=0.9, session_id="test-session"
-        ))
-        await detector.handle_vad_event(VADEvent(
-            state=VADState.ENDPOINT, t_ms=2000, probability=0.1, session_id="test-session"
-        ))
+        await _drive_events(detector, (VAD_SPEECH_1000, VAD_ENDPOINT_2000))
 
         assert len(endpoint_events) == 1
         assert endpoint_events[0].reason == "vad_endpoint"
 
-    @pytest.mark.asyncio
     async def test_state_change_callback(self, detector):
         """State change callback is invoked for all transitions."""
         state_changes = []
@@ -319,34 +288,25 @@ class TestTurnDetectorCallbacks:
         detector.on_state_change(on_state_change)
 
         # Trigger transitions
-        await detector.handle_vad_event(VADEvent(
-            state=VADState.SPEECH, t_ms=1000, probability=0.9, session_id="test-session"
-        ))
-        await detector.handle_vad_event(VADEvent(
-            state=VADState.ENDPOINT, t_ms=2000, probability=0.1, session_id="test-session"
-        ))
+        await _drive_events(detector, (VAD_SPEECH_1000, VAD_ENDPOINT_2000))
 
         # Should have: IDLE->LISTENING, ENDPOINT_DETECTED->THINKING
         assert len(state_changes) == 2
 
-    @pytest.mark.asyncio
     async def test_async_callback(self, detector):
         """Async callbacks are properly awaited."""
         events = []
 
         async def async_callback(event):
-            await asyncio.sleep(0.001)
+            await asyncio.sleep(0)
             events.append(event)
 
         detector.on_state_change(async_callback)
 
-        await detector.handle_vad_event(VADEvent(
-            state=VADState.SPEECH, t_ms=1000, probability=0.9, session_id="test-session"
-        ))
+        await detector.handle_vad_event(VAD_SPEECH_1000)
 
         assert len(events) == 1
 
-    @pytest.mark.asyncio
     async def test_callback_error_handling(self, detector):
         """Callback errors don't break the detector."""
         def bad_callback(event):
@@ -355,49 +315,29 @@ class TestTurnDetectorCallbacks:
         detector.on_state_change(bad_callback)
 
         # Should not raise
-        await detector.handle_vad_event(VADEvent(
-            state=VADState.SPEECH, t_ms=1000, probability=0.9, session_id="test-session"
-        ))
+        await detector.handle_vad_event(VAD_SPEECH_1000)
 
         assert detector.state == TurnState.LISTENING
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestTurnDetectorTTFA:
     """Tests for TTFA tracking."""
 
-    @pytest.fixture
-    def detector(self):
-        """Create detector with mocked clock."""
-        with patch("src.orchestrator.turn_detector.get_audio_clock") as mock_clock:
-            mock_clock.return_value.get_time_ms.return_value = 1000
-            mock_clock.return_value.get_reading.return_value.raw_ns = 1000000000
-            mock_clock.return_value.measure_elapsed_ms.return_value = 5.0
-            detector = TurnDetector(session_id="test-session")
-            yield detector
-
-    @pytest.mark.asyncio
     async def test_ttfa_start_recorded(self, detector):
         """TTFA start point is recorded on endpoint."""
         assert detector.ttfa_start_ms is None
 
-        await detector.handle_vad_event(VADEvent(
-            state=VADState.SPEECH, t_ms=1000, probability=0.9, session_id="test-session"
-        ))
-        await detector.handle_vad_event(VADEvent(
-            state=VADState.ENDPOINT, t_ms=2500, probability=0.1, session_id="test-session"
+        await _drive_events(detector, (
+            VAD_SPEECH_1000,
+            VADEvent(state=VADState.ENDPOINT, t_ms=2500, probability=0.1, session_id=_SID),
         ))
 
         assert detector.ttfa_start_ms == 2500
 
-    @pytest.mark.asyncio
     async def test_ttfa_reset_on_turn_reset(self, detector):
         """TTFA is reset when turn is reset."""
-        await detector.handle_vad_event(VADEvent(
-            state=VADState.SPEECH, t_ms=1000, probability=0.9, session_id="test-session"
-        ))
-        await detector.handle_vad_event(VADEvent(
-            state=VADState.ENDPOINT, t_ms=2000, probability=0.1, session_id="test-session"
-        ))
+        await _drive_events(detector, (VAD_SPEECH_1000, VAD_ENDPOINT_2000))
         assert detector.ttfa_start_ms is not None
 
         await detector.reset_turn("timeout")
@@ -406,92 +346,60 @@ class TestTurnDetectorTTFA:
         assert detector.state == TurnState.LISTENING
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestTurnDetectorEdgeCases:
     """Tests for edge cases."""
 
-    @pytest.fixture
-    def detector(self):
-        """Create detector with mocked clock."""
-        with patch("src.orchestrator.turn_detector.get_audio_clock") as mock_clock:
-            mock_clock.return_value.get_time_ms.return_value = 1000
-            mock_clock.return_value.get_reading.return_value.raw_ns = 1000000000
-            mock_clock.return_value.measure_elapsed_ms.return_value = 5.0
-            detector = TurnDetector(session_id="test-session")
-            yield detector
-
-    @pytest.mark.asyncio
-    async def test_endpoint_ignored_when_not_listening(self, detector):
-        """Endpoint is ignored if not in LISTENING state."""
-        assert detector.state == TurnState.IDLE
-
-        result = await detector.handle_vad_event(VADEvent(
-            state=VADState.ENDPOINT, t_ms=1000, probability=0.1, session_id="test-session"
-        ))
-
-        assert result is None
+    @pytest.mark.parametrize(
+        "action",
+        [
+            lambda d: d.handle_vad_event(VAD_ENDPOINT_1000),
+            lambda d: d.start_speaking(),
+            lambda d: d.finish_speaking(),
+        ],
+        ids=["endpoint_not_listening", "start_not_thinking", "finish_not_speaking"],
+    )
+    async def test_ignored_when_wrong_state(self, detector, action):
+        """Transitions from the wrong state are ignored and leave IDLE intact."""
         assert detector.state == TurnState.IDLE
 
-    @pytest.mark.asyncio
-    async def test_start_speaking_ignored_when_not_thinking(self, detector):
-        """start_speaking is ignored if not in THINKING state."""
-        assert detector.state == TurnState.IDLE
-
-        result = await detector.start_speaking()
+        result = await action(detector)
 
         assert result is None
         assert detector.state == TurnState.IDLE
 
-    @pytest.mark.asyncio
-    async def test_finish_speaking_ignored_when_not_speaking(self, detector):
-        """finish_speaking is ignored if not in SPEAKING state."""
-        assert detector.state == TurnState.IDLE
-
-        result = await detector.finish_speaking()
-
-        assert result is None
-        assert detector.state == TurnState.IDLE
-
-    @pytest.mark.asyncio
     async def test_speech_during_listening_is_noop(self, detector):
         """Speech event during LISTENING is a no-op."""
-        await detector.handle_vad_event(VADEvent(
-            state=VADState.SPEECH, t_ms=1000, probability=0.9, session_id="test-session"
-        ))
+        await detector.handle_vad_event(VAD_SPEECH_1000)
         assert detector.state == TurnState.LISTENING
 
         # Another speech event
         result = await detector.handle_vad_event(VADEvent(
-            state=VADState.SPEECH, t_ms=1500, probability=0.9, session_id="test-session"
+            state=VADState.SPEECH, t_ms=1500, probability=0.9, session_id=_SID
         ))
 
         assert result is None
         assert detector.state == TurnState.LISTENING
 
-    @pytest.mark.asyncio
     async def test_is_user_turn_property(self, detector):
         """is_user_turn reflects LISTENING state."""
         assert detector.is_user_turn is False
 
-        await detector.handle_vad_event(VADEvent(
-            state=VADState.SPEECH, t_ms=1000, probability=0.9, session_id="test-session"
-        ))
+        await detector.handle_vad_event(VAD_SPEECH_1000)
 
         assert detector.is_user_turn is True
 
-    @pytest.mark.asyncio
     async def test_is_agent_turn_property(self, detector):
         """is_agent_turn reflects THINKING or SPEAKING state."""
         assert detector.is_agent_turn is False
 
-        await detector.handle_vad_event(VADEvent(
-            state=VADState.SPEECH, t_ms=1000, probability=0.9, session_id="test-session"
-        ))
-        await detector.handle_vad_event(VADEvent(
-            state=VADState.ENDPOINT, t_ms=2000, probability=0.1, session_id="test-session"
-        ))
+        await _drive_to(detector, TurnState.THINKING)
 
         assert detector.is_agent_turn is True  # THINKING
 
         await detector.start_speaking()
 
         assert detector.is_agent_turn is True  # SPEAKING
+        assert TurnDetector._AGENT_STATES == frozenset(
+            {TurnState.THINKING, TurnState.SPEAKING}
+        )
@@ -4,7 +4,10 @@ Tests the vLLM client configuration and helper functions.
 Note: Tests that require an actual vLLM server are marked with requires_vllm.
 """
 
+from collections import namedtuple
+
 import pytest
+import pytest_asyncio
 
 from src.exceptions import LLMGenerationError
 from src.llm.vllm_client import (
@@ -15,6 +18,33 @@ from src.llm.vllm_client import (
     create_vllm_client,
 )
 
+# Lightweight stand-ins for OpenAI streaming chunks
+Delta = namedtuple("Delta", "content")
+Choice = namedtuple("Choice", "delta")
+Chunk = namedtuple("Chunk", "choices")
+
+
+def _chunk(content: str | None) -> Chunk:
+    """Build a single-choice streaming chunk carrying content."""
+    return Chunk(choices=[Choice(delta=Delta(content=content))])
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def _module_client():
+    """One started client shared by tests that don't restart it."""
+    client = VLLMClient(LLMConfig(base_url="http://localhost:8000/v1"))
+    await client.start()
+    yield client
+    await client.stop()
+
+
+@pytest.fixture
+def started_client(_module_client):
+    """Shared started client with per-test abort state reset."""
+    _module_client._aborted = False
+    _module_client._streams.clear()
+    return _module_client
+
 
 class TestLLMConfig:
     """Tests for LLMConfig dataclass."""
@@ -29,6 +59,8 @@ class TestLLMConfig:
         assert config.top_p == 0.95
         assert config.timeout_s == 30.0
         assert config.stream is True
+        assert config.http2 is True
+        assert config.prefix_cache_salt is False
 
     def test_custom_config(self):
         """Custom config values are applied."""
@@ -49,6 +81,28 @@ class TestLLMConfig:
         assert config.timeout_s == 60.0
         assert config.stream is False
 
+    def test_default_config_from_settings(self):
+        """Clients built without a config derive it from settings."""
+        from src.config.settings import get_settings
+
+        settings = get_settings()
+        config = VLLMClient()._config
+        assert config.base_url == settings.llm_base_url
+        assert config.model == settings.llm_model_path.split("/")[-1]
+
+    def test_config_is_immutable(self):
+        """Shared configs cannot be mutated."""
+        import dataclasses
+
+        config = LLMConfig()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.model = "other"
+
+    def test_llmconfig_is_hashable(self):
+        """Equal configs hash equal, so they can key caches."""
+        assert hash(LLMConfig()) == hash(LLMConfig())
+        assert not hasattr(LLMConfig(), "__dict__")
+
 
 class TestLLMResponse:
     """Tests for LLMResponse dataclass."""
@@ -74,6 +128,15 @@ class TestLLMResponse:
         assert response.tokens_used == 5
         assert response.is_complete is True
 
+    def test_response_is_immutable(self):
+        """Responses are frozen and slotted."""
+        import dataclasses
+
+        response = LLMResponse(text="Hello")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            response.text = "changed"
+        assert not hasattr(response, "__dict__")
+
 
 class TestBuildMessages:
     """Tests for build_messages helper function."""
@@ -138,6 +201,24 @@ class TestBuildMessages:
 
         assert len(messages) == 12  # 1 system + 10 history + 1 user
 
+    def test_history_shared_by_reference(self):
+        """Long histories are spliced in without copying each turn."""
+        history = [
+            {"role": "user" if i % 2 == 0 else "assistant", "content": str(i)}
+            for i in range(1000)
+        ]
+
+        messages = build_messages(
+            system_prompt="System",
+            conversation=history,
+            user_input="Final",
+        )
+
+        assert len(messages) == 1002
+        assert messages[1] is history[0]
+        assert messages[-2] is history[-1]
+        assert messages[-1] == {"role": "user", "content": "Final"}
+
 
 class TestVLLMClient:
     """Tests for VLLMClient that don't require a server."""
@@ -166,6 +247,7 @@ class TestVLLMClient:
         await client.start()
         assert client.is_running
         assert client._client is not None
+        assert client._create == client._client.chat.completions.create
 
         await client.stop()
 
@@ -181,6 +263,84 @@ class TestVLLMClient:
         assert not client.is_running
         assert client._client is None
 
+    @pytest.mark.asyncio
+    async def test_start_uses_pooled_http_client(self):
+        """Start wires a shared keep-alive httpx pool into the OpenAI client."""
+        from unittest.mock import AsyncMock, patch
+
+        import httpx
+
+        from src.llm.vllm_client import (
+            HTTP_KEEPALIVE_EXPIRY_S,
+            HTTP_MAX_CONNECTIONS,
+            HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        )
+
+        config = LLMConfig(base_url="http://localhost:8000/v1")
+        client = VLLMClient(config)
+
+        with (
+            patch("src.llm.vllm_client.httpx.AsyncClient") as mock_http_cls,
+            patch("src.llm.vllm_client.AsyncOpenAI") as mock_openai_cls,
+        ):
+            http_client = mock_http_cls.return_value
+            http_client.aclose = AsyncMock()
+            mock_openai_cls.return_value.close = AsyncMock()
+
+            await client.start()
+
+            mock_http_cls.assert_called_once_with(
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_S,
+                ),
+                timeout=config.timeout_s,
+                http2=True,
+            )
+            assert mock_openai_cls.call_args.kwargs["http_client"] is http_client
+
+            await client.stop()
+
+        http_client.aclose.assert_awaited_once()
+        assert client._http_client is None
+
+    @pytest.mark.asyncio
+    async def test_reuses_connection(self):
+        """Sequential requests share one pooled keep-alive connection."""
+        import asyncio
+
+        connects = 0
+
+        async def handle(reader, writer):
+            nonlocal connects
+            connects += 1
+            try:
+                while await reader.readuntil(b"\r\n\r\n"):
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n"
+                        b"Connection: keep-alive\r\n\r\n{}"
+                    )
+                    await writer.drain()
+            except asyncio.IncompleteReadError:
+                writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+
+        client = VLLMClient(LLMConfig(base_url=f"http://127.0.0.1:{port}/v1"))
+        await client.start()
+        try:
+            for _ in range(3):
+                response = await client._http_client.get(f"http://127.0.0.1:{port}/v1/models")
+                assert response.status_code == 200
+        finally:
+            await client.stop()
+            server.close()
+            await server.wait_closed()
+
+        assert connects == 1
+
     @pytest.mark.asyncio
     async def test_generate_requires_start(self):
         """Generate fails if client not started."""
@@ -199,33 +359,35 @@ class TestVLLMClient:
                 pass
 
     @pytest.mark.asyncio
-    async def test_abort_sets_event(self):
-        """Abort sets the abort event."""
+    async def test_abort_marks_aborted(self):
+        """Abort marks the client aborted and is idempotent."""
         config = LLMConfig(base_url="http://localhost:8000/v1")
         client = VLLMClient(config)
 
         await client.start()
-        assert not client._abort_event.is_set()
+        assert not client._aborted
 
         await client.abort()
-        assert client._abort_event.is_set()
+        await client.abort()
+        assert client._aborted
 
         await client.stop()
 
     @pytest.mark.asyncio
-    async def test_start_clears_abort_event(self):
-        """Start clears any previous abort event."""
+    async def test_start_clears_aborted(self):
+        """Start clears any previous abort."""
         config = LLMConfig(base_url="http://localhost:8000/v1")
         client = VLLMClient(config)
 
         await client.start()
         await client.abort()
-        assert client._abort_event.is_set()
+        assert client._aborted
 
         # Restart should clear abort
         await client.stop()
         await client.start()
-        assert not client._abort_event.is_set()
+        assert not client._aborted
+        assert not client._streams
 
         await client.stop()
 
@@ -260,23 +422,17 @@ class TestVLLMClientStreaming:
     @pytest.mark.asyncio
     async def test_generate_stream_with_mock_client(self):
         """Test streaming with mocked OpenAI client."""
-        from unittest.mock import AsyncMock, MagicMock, patch
+        from unittest.mock import AsyncMock, patch
 
         config = LLMConfig(base_url="http://localhost:8000/v1")
         client = VLLMClient(config)
 
         # Create mock chunk response
-        mock_chunk1 = MagicMock()
-        mock_chunk1.choices = [MagicMock()]
-        mock_chunk1.choices[0].delta.content = "Hello"
+        mock_chunk1 = _chunk("Hello")
 
-        mock_chunk2 = MagicMock()
-        mock_chunk2.choices = [MagicMock()]
-        mock_chunk2.choices[0].delta.content = " world"
+        mock_chunk2 = _chunk(" world")
 
-        mock_chunk3 = MagicMock()
-        mock_chunk3.choices = [MagicMock()]
-        mock_chunk3.choices[0].delta.content = None  # End chunk
+        mock_chunk3 = _chunk(None)  # End chunk
 
         async def mock_chunks():
             yield mock_chunk1
@@ -285,6 +441,7 @@ class TestVLLMClientStreaming:
 
         with patch.object(client, "_client") as mock_openai:
             mock_openai.chat.completions.create = AsyncMock(return_value=mock_chunks())
+            client._create = mock_openai.chat.completions.create
             client._running = True
 
             tokens = []
@@ -294,49 +451,149 @@ class TestVLLMClientStreaming:
             assert tokens == ["Hello", " world"]
 
     @pytest.mark.asyncio
-    async def test_generate_stream_aborts_on_event(self):
-        """Test streaming aborts when abort event is set."""
+    async def test_generate_stream_aborts_without_cancelling_consumer(self):
+        """Abort ends the stream quietly; the consuming task is not cancelled."""
+        import asyncio
         from unittest.mock import AsyncMock, MagicMock, patch
 
-        config = LLMConfig(base_url="http://localhost:8000/v1")
-        client = VLLMClient(config)
+        client = VLLMClient(LLMConfig(base_url="http://localhost:8000/v1"))
 
-        mock_chunk = MagicMock()
-        mock_chunk.choices = [MagicMock()]
-        mock_chunk.choices[0].delta.content = "Token"
+        mock_chunk = _chunk("Token")
+        first_token = asyncio.Event()
+        closed = asyncio.Event()
 
         async def mock_chunks():
             yield mock_chunk
-            client._abort_event.set()  # Set abort during streaming
-            yield mock_chunk
+            first_token.set()
+            await closed.wait()  # Stalled upstream until the response is closed
+            raise ConnectionError("stream closed")
+
+        stream = MagicMock()
+        stream.__aiter__ = lambda self: mock_chunks()
+        stream.aclose = AsyncMock(side_effect=lambda: closed.set())
 
         with patch.object(client, "_client") as mock_openai:
-            mock_openai.chat.completions.create = AsyncMock(return_value=mock_chunks())
+            mock_openai.chat.completions.create = AsyncMock(return_value=stream)
+            client._create = mock_openai.chat.completions.create
             client._running = True
 
             tokens = []
-            async for token in client.generate_stream([{"role": "user", "content": "Hi"}]):
-                tokens.append(token)
 
-            # Should have stopped early
-            assert len(tokens) == 1
+            async def consume():
+                async for token in client.generate_stream([{"role": "user", "content": "Hi"}]):
+                    tokens.append(token)
+                return "finished"
+
+            task = asyncio.create_task(consume())
+            await first_token.wait()
+            assert len(client._streams) == 1
+
+            await client.abort()
+
+            stream.aclose.assert_awaited_once()
+            assert await task == "finished"
+            assert tokens == ["Token"]
+            assert not client._streams
+
+    @pytest.mark.asyncio
+    async def test_abort_flags_each_active_stream(self):
+        """Every in-flight stream stops at its next chunk after abort."""
+        import asyncio
+        from unittest.mock import AsyncMock, patch
+
+        client = VLLMClient(LLMConfig(base_url="http://localhost:8000/v1"))
+
+        mock_chunk = _chunk("Token")
+        release = asyncio.Event()
+        started = []
+
+        async def mock_chunks():
+            yield mock_chunk
+            started.append(True)
+            await release.wait()
+            yield mock_chunk
+
+        with patch.object(client, "_client") as mock_openai:
+            mock_openai.chat.completions.create = AsyncMock(
+                side_effect=lambda **_: mock_chunks()
+            )
+            client._create = mock_openai.chat.completions.create
+            client._running = True
+
+            async def consume():
+                return [
+                    token
+                    async for token in client.generate_stream(
+                        [{"role": "user", "content": "Hi"}]
+                    )
+                ]
+
+            tasks = [asyncio.create_task(consume()) for _ in range(2)]
+            while len(started) < 2:
+                await asyncio.sleep(0)
+
+            await client.abort()
+            assert len(client._streams) == 2
+            assert all(s.aborted for s in client._streams)
+            release.set()
+
+            assert await asyncio.gather(*tasks) == [["Token"], ["Token"]]
+            assert not client._streams
+
+    @pytest.mark.asyncio
+    async def test_cancelled_consumer_closes_upstream_stream(self):
+        """Cancelling the consumer mid-stream closes the upstream response."""
+        import asyncio
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        client = VLLMClient(LLMConfig(base_url="http://localhost:8000/v1"))
+
+        mock_chunk = _chunk("Token")
+        first_token = asyncio.Event()
+
+        async def mock_chunks():
+            yield mock_chunk
+            first_token.set()
+            await asyncio.sleep(100)
+
+        stream = MagicMock()
+        stream.__aiter__ = lambda self: mock_chunks()
+        stream.aclose = AsyncMock()
+
+        with patch.object(client, "_client") as mock_openai:
+            mock_openai.chat.completions.create = AsyncMock(return_value=stream)
+            client._create = mock_openai.chat.completions.create
+            client._running = True
+
+            async def consume():
+                async for _ in client.generate_stream([{"role": "user", "content": "Hi"}]):
+                    pass
+
+            task = asyncio.create_task(consume())
+            await first_token.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            stream.aclose.assert_awaited_once()
+            assert not client._streams
 
     @pytest.mark.asyncio
     async def test_generate_stream_handles_empty_choices(self):
         """Test streaming handles empty choices."""
-        from unittest.mock import AsyncMock, MagicMock, patch
+        from unittest.mock import AsyncMock, patch
 
         config = LLMConfig(base_url="http://localhost:8000/v1")
         client = VLLMClient(config)
 
-        mock_chunk = MagicMock()
-        mock_chunk.choices = []  # Empty choices
+        mock_chunk = Chunk(choices=[])  # Empty choices
 
         async def mock_chunks():
             yield mock_chunk
 
         with patch.object(client, "_client") as mock_openai:
             mock_openai.chat.completions.create = AsyncMock(return_value=mock_chunks())
+            client._create = mock_openai.chat.completions.create
             client._running = True
 
             tokens = []
@@ -352,18 +609,14 @@ class TestVLLMClientGenerate:
     @pytest.mark.asyncio
     async def test_generate_collects_tokens(self):
         """Test generate collects all tokens into response."""
-        from unittest.mock import AsyncMock, MagicMock, patch
+        from unittest.mock import AsyncMock, patch
 
         config = LLMConfig(base_url="http://localhost:8000/v1")
         client = VLLMClient(config)
 
-        mock_chunk1 = MagicMock()
-        mock_chunk1.choices = [MagicMock()]
-        mock_chunk1.choices[0].delta.content = "Hello"
+        mock_chunk1 = _chunk("Hello")
 
-        mock_chunk2 = MagicMock()
-        mock_chunk2.choices = [MagicMock()]
-        mock_chunk2.choices[0].delta.content = " world"
+        mock_chunk2 = _chunk(" world")
 
         async def mock_chunks():
             yield mock_chunk1
@@ -371,6 +624,7 @@ class TestVLLMClientGenerate:
 
         with patch.object(client, "_client") as mock_openai:
             mock_openai.chat.completions.create = AsyncMock(return_value=mock_chunks())
+            client._create = mock_openai.chat.completions.create
             client._running = True
 
             response = await client.generate([{"role": "user", "content": "Hi"}])
@@ -378,70 +632,81 @@ class TestVLLMClientGenerate:
             assert response.text == "Hello world"
             assert response.is_complete is True
 
+    @pytest.mark.asyncio
+    async def test_generate_large_response(self):
+        """Long streams are accumulated into a single text."""
+        from unittest.mock import AsyncMock, patch
 
-class TestVLLMClientAbort:
-    """Tests for abort functionality."""
+        client = VLLMClient(LLMConfig(base_url="http://localhost:8000/v1"))
+        chunk = _chunk("ab")
+        n_chunks = 10_000
+
+        async def mock_chunks():
+            for _ in range(n_chunks):
+                yield chunk
+
+        with patch.object(client, "_client") as mock_openai:
+            mock_openai.chat.completions.create = AsyncMock(return_value=mock_chunks())
+            client._create = mock_openai.chat.completions.create
+            client._running = True
+
+            response = await client.generate([{"role": "user", "content": "Hi"}])
+
+        assert response.text == "ab" * n_chunks
+        assert response.is_complete is True
 
     @pytest.mark.asyncio
-    async def test_abort_cancels_current_task(self):
-        """Test abort cancels current task if present."""
+    async def test_concurrent_generate_not_merged(self):
+        """Identical concurrent generate calls each issue their own request."""
         import asyncio
+        from unittest.mock import AsyncMock, patch
 
-        config = LLMConfig(base_url="http://localhost:8000/v1")
-        client = VLLMClient(config)
-        await client.start()
+        client = VLLMClient(LLMConfig(base_url="http://localhost:8000/v1"))
 
-        # Create a task
-        async def long_task():
-            await asyncio.sleep(100)
+        mock_chunk = _chunk("Hello")
 
-        client._current_task = asyncio.create_task(long_task())
+        async def mock_chunks():
+            await asyncio.sleep(0)
+            yield mock_chunk
 
-        await client.abort()
+        with patch.object(client, "_client") as mock_openai:
+            mock_openai.chat.completions.create = AsyncMock(
+                side_effect=lambda **_: mock_chunks()
+            )
+            client._create = mock_openai.chat.completions.create
+            client._running = True
 
-        assert client._abort_event.is_set()
-        # Task should be cancelled
-        assert client._current_task.cancelled() or client._current_task.done()
+            messages = [{"role": "user", "content": "Hi"}]
+            responses = await asyncio.gather(*(client.generate(messages) for _ in range(3)))
 
-        await client.stop()
+            assert mock_openai.chat.completions.create.call_count == 3
+            assert all(r.text == "Hello" for r in responses)
 
-    @pytest.mark.asyncio
-    async def test_abort_handles_no_task(self):
-        """Test abort handles case with no current task."""
-        config = LLMConfig(base_url="http://localhost:8000/v1")
-        client = VLLMClient(config)
-        await client.start()
 
-        # No current task
-        client._current_task = None
+@pytest.mark.asyncio(loop_scope="module")
+class TestVLLMClientAbort:
+    """Tests for abort functionality."""
+
+    async def test_abort_handles_no_streams(self, started_client):
+        """Test abort with no stream in flight."""
+        client = started_client
 
         # Should not raise
         await client.abort()
 
-        assert client._abort_event.is_set()
+        assert client._aborted
 
-        await client.stop()
+    async def test_abort_flags_registered_stream(self, started_client):
+        """Test abort flags a registered stream that has no response yet."""
+        from src.llm.vllm_client import _ActiveStream
 
-    @pytest.mark.asyncio
-    async def test_abort_handles_completed_task(self):
-        """Test abort handles completed task."""
-        import asyncio
-
-        config = LLMConfig(base_url="http://localhost:8000/v1")
-        client = VLLMClient(config)
-        await client.start()
-
-        # Create and complete a task
-        async def quick_task():
-            return "done"
+        client = started_client
+        stream = _ActiveStream()
+        client._streams.add(stream)
 
-        client._current_task = asyncio.create_task(quick_task())
-        await asyncio.sleep(0.01)  # Let it complete
-
-        # Should not raise
         await client.abort()
 
-        await client.stop()
+        assert stream.aborted
 
 
 class TestVLLMClientErrorHandling:
@@ -459,6 +724,7 @@ class TestVLLMClientErrorHandling:
             mock_openai.chat.completions.create = AsyncMock(
                 side_effect=Exception("API error")
             )
+            client._create = mock_openai.chat.completions.create
             client._running = True
 
             with pytest.raises(LLMGenerationError, match="API error"):
@@ -478,6 +744,7 @@ class TestVLLMClientErrorHandling:
             mock_openai.chat.completions.create = AsyncMock(
                 side_effect=asyncio.CancelledError()
             )
+            client._create = mock_openai.chat.completions.create
             client._running = True
 
             with pytest.raises(asyncio.CancelledError):
@@ -491,7 +758,7 @@ class TestVLLMClientKwargs:
     @pytest.mark.asyncio
     async def test_generate_stream_uses_kwargs(self):
         """Test generate_stream uses provided kwargs."""
-        from unittest.mock import AsyncMock, MagicMock, patch
+        from unittest.mock import AsyncMock, patch
 
         config = LLMConfig(base_url="http://localhost:8000/v1")
         client = VLLMClient(config)
@@ -502,6 +769,7 @@ class TestVLLMClientKwargs:
 
         with patch.object(client, "_client") as mock_openai:
             mock_openai.chat.completions.create = AsyncMock(return_value=mock_chunks())
+            client._create = mock_openai.chat.completions.create
             client._running = True
 
             async for _ in client.generate_stream(
@@ -517,3 +785,81 @@ class TestVLLMClientKwargs:
             assert call_kwargs["max_tokens"] == 100
             assert call_kwargs["temperature"] == 0.5
             assert call_kwargs["top_p"] == 0.8
+
+    @pytest.mark.asyncio
+    async def test_cache_salt_included_for_system_prompt(self):
+        """Identical system prompts produce the same deterministic cache salt."""
+        from unittest.mock import AsyncMock, patch
+
+        client = VLLMClient(
+            LLMConfig(base_url="http://localhost:8000/v1", prefix_cache_salt=True)
+        )
+
+        async def mock_chunks():
+            return
+            yield  # Empty generator
+
+        salts = []
+        with patch.object(client, "_client") as mock_openai:
+            mock_openai.chat.completions.create = AsyncMock(
+                side_effect=lambda **_: mock_chunks()
+            )
+            client._create = mock_openai.chat.completions.create
+            client._running = True
+
+            for user_input in ("Hi", "Bye"):
+                messages = build_messages("You are helpful.", [], user_input)
+                async for _ in client.generate_stream(messages):
+                    pass
+                call_kwargs = mock_openai.chat.completions.create.call_args.kwargs
+                salts.append(call_kwargs["extra_body"]["cache_salt"])
+
+        assert salts[0] == salts[1]
+        assert len(salts[0]) == 16
+
+    @pytest.mark.asyncio
+    async def test_no_cache_salt_by_default(self):
+        """cache_salt is opt-in; default requests carry no extra_body."""
+        from unittest.mock import AsyncMock, patch
+
+        client = VLLMClient(LLMConfig(base_url="http://localhost:8000/v1"))
+
+        async def mock_chunks():
+            return
+            yield  # Empty generator
+
+        with patch.object(client, "_client") as mock_openai:
+            mock_openai.chat.completions.create = AsyncMock(return_value=mock_chunks())
+            client._create = mock_openai.chat.completions.create
+            client._running = True
+
+            messages = build_messages("You are helpful.", [], "Hi")
+            async for _ in client.generate_stream(messages):
+                pass
+
+            call_kwargs = mock_openai.chat.completions.create.call_args.kwargs
+            assert "extra_body" not in call_kwargs
+
+    @pytest.mark.asyncio
+    async def test_no_cache_salt_without_system_prompt(self):
+        """Requests without a system prompt carry no extra_body."""
+        from unittest.mock import AsyncMock, patch
+
+        client = VLLMClient(
+            LLMConfig(base_url="http://localhost:8000/v1", prefix_cache_salt=True)
+        )
+
+        async def mock_chunks():
+            return
+            yield  # Empty generator
+
+        with patch.object(client, "_client") as mock_openai:
+            mock_openai.chat.completions.create = AsyncMock(return_value=mock_chunks())
+            client._create = mock_openai.chat.completions.create
+            client._running = True
+
+            async for _ in client.generate_stream([{"role": "user", "content": "Hi"}]):
+                pass
+
+            call_kwargs = mock_openai.chat.completions.create.call_args.kwargs
+            assert "extra_body" not in call_kwargs
@@ -1,8 +1,10 @@
 """Tests for WebRTC Gateway."""
 
 import asyncio
-import json
+
+import numpy as np
 import pytest
+from orjson import loads
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.api.webrtc.gateway import (
@@ -14,6 +16,39 @@ from src.api.webrtc.gateway import (
 )
 
 
+@pytest.fixture
+def mock_pc_factory():
+    """Factory for mocked RTCPeerConnections with an open data channel."""
+
+    def _make(answer_sdp: str = "answer") -> MagicMock:
+        mock_pc = MagicMock()
+        mock_pc.connectionState = "new"
+
+        # Mock async methods
+        mock_pc.setRemoteDescription = AsyncMock()
+        mock_pc.createAnswer = AsyncMock()
+        mock_pc.setLocalDescription = AsyncMock()
+        mock_pc.addIceCandidate = AsyncMock()
+        mock_pc.close = AsyncMock()
+
+        # Mock local description
+        mock_pc.localDescription.sdp = answer_sdp
+
+        # Mock data channel with proper on decorator and readyState
+        mock_channel = MagicMock()
+        mock_channel.on = MagicMock(side_effect=lambda event: lambda fn: fn)
+        mock_channel.readyState = "open"
+        mock_channel.bufferedAmount = 0
+        mock_pc.createDataChannel.return_value = mock_channel
+
+        # Mock on decorator to return identity function
+        mock_pc.on = MagicMock(side_effect=lambda event: lambda fn: fn)
+
+        return mock_pc
+
+    return _make
+
+
 class TestWebRTCConfig:
     """Tests for WebRTCConfig dataclass."""
 
@@ -21,14 +56,19 @@ class TestWebRTCConfig:
         """Test default configuration values."""
         config = WebRTCConfig()
 
-        assert len(config.stun_servers) == 2
-        assert "stun:stun.l.google.com:19302" in config.stun_servers
-        assert config.turn_servers == []
+        assert config.stun_servers == (
+            "stun:stun.l.google.com:19302",
+            "stun:stun1.l.google.com:19302",
+        )
+        assert config.turn_servers == ()
         assert config.enable_data_channel is True
         assert config.data_channel_ordered is False
         assert config.data_channel_max_retransmits == 0
         assert config.audio_sample_rate == 16000
         assert config.audio_channels == 1
+        assert config.blendshape_batch_size == 1
+        assert config.blendshape_flush_ms == 8.0
+        assert config.max_buffered_bytes == 65536
 
     def test_custom_config(self):
         """Test custom configuration."""
@@ -55,6 +95,14 @@ class TestWebRTCConfig:
         assert config.audio_sample_rate == 48000
         assert config.audio_channels == 2
 
+    def test_config_is_immutable(self):
+        """Shared configs cannot be mutated."""
+        import dataclasses
+
+        config = WebRTCConfig()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.enable_data_channel = False
+
 
 class TestPeerConnectionState:
     """Tests for PeerConnectionState dataclass."""
@@ -71,6 +119,13 @@ class TestPeerConnectionState:
         assert state.is_connected is False
         assert state.is_audio_active is False
 
+    def test_peer_connection_state_uses_slots(self):
+        """Test per-session state has a fixed slotted layout."""
+        state = PeerConnectionState(session_id="test-123", pc=MagicMock())
+
+        assert not hasattr(state, "__dict__")
+        assert "session_id" in PeerConnectionState.__slots__
+
 
 class TestAudioTrackSink:
     """Tests for AudioTrackSink."""
@@ -87,7 +142,7 @@ class TestAudioTrackSink:
 
         # Create mock track that yields one frame then stops
         mock_frame = MagicMock()
-        mock_frame.to_ndarray.return_value = MagicMock(tobytes=lambda: b"audio_data")
+        mock_frame.to_ndarray.return_value = np.frombuffer(b"audio_data", dtype=np.int16)
         mock_frame.pts = 1000
         mock_frame.sample_rate = 16000
 
@@ -97,7 +152,84 @@ class TestAudioTrackSink:
         await sink.start(mock_track)
 
         assert len(received_audio) == 1
-        assert received_audio[0][0] == b"audio_data"
+        assert bytes(received_audio[0][0]) == b"audio_data"
+
+    def test_write_frame_reuses_ring_slots(self):
+        """Test frames are written into preallocated ring slots."""
+        sink = AudioTrackSink(
+            session_id="test-123", on_audio=lambda a, t: None, ring_slots=2, max_queue=1
+        )
+
+        # Ring holds ring_slots + max_queue frames
+        frames = [np.full(4, i, dtype=np.int16) for i in range(4)]
+        views = [sink._write_frame(f) for f in frames]
+
+        assert bytes(views[1]) == frames[1].tobytes()
+        assert bytes(views[2]) == frames[2].tobytes()
+        assert bytes(views[3]) == frames[3].tobytes()
+        # Fourth frame wrapped around into the first slot
+        assert views[3].obj is views[0].obj
+        assert bytes(views[0]) == frames[3].tobytes()
+
+    @pytest.mark.asyncio
+    async def test_audio_drops_oldest_under_backpressure(self):
+        """Test a slow callback gets the newest frames and skips stale ones."""
+        received = []
+
+        async def slow_on_audio(audio, timestamp):
+            received.append(bytes(audio))
+            await asyncio.sleep(0.01)
+
+        frames = [np.full(4, i, dtype=np.int16) for i in range(100)]
+        pending = iter(frames)
+
+        async def recv():
+            await asyncio.sleep(0)
+            samples = next(pending, None)
+            if samples is None:
+                raise Exception("End of stream")
+            frame = MagicMock(pts=0, sample_rate=16000)
+            frame.to_ndarray.return_value = samples
+            return frame
+
+        mock_track = MagicMock()
+        mock_track.recv = recv
+
+        sink = AudioTrackSink(session_id="test-123", on_audio=slow_on_audio, max_queue=8)
+        await sink.start(mock_track)
+
+        assert len(received) < 100
+        assert received[-1] == frames[99].tobytes()
+        assert sink._frames_dropped == 100 - len(received)
+
+    @pytest.mark.asyncio
+    async def test_audio_callback_error_does_not_stop_sink(self):
+        """Test a failing callback is logged and delivery continues."""
+        received = []
+
+        def on_audio(audio, timestamp):
+            received.append(bytes(audio))
+            if len(received) == 1:
+                raise ValueError("callback error")
+
+        mock_frame = MagicMock(pts=0, sample_rate=16000)
+        mock_frame.to_ndarray.return_value = np.zeros(4, dtype=np.int16)
+        mock_track = AsyncMock()
+        mock_track.recv.side_effect = [mock_frame, mock_frame, Exception("End of stream")]
+
+        sink = AudioTrackSink(session_id="test-123", on_audio=on_audio)
+        await sink.start(mock_track)
+
+        assert len(received) == 2
+
+    def test_write_frame_grows_for_larger_frames(self):
+        """Test the ring is resized when a frame exceeds the slot size."""
+        sink = AudioTrackSink(session_id="test-123", on_audio=lambda a, t: None)
+
+        sink._write_frame(np.zeros(4, dtype=np.int16))
+        view = sink._write_frame(np.arange(16, dtype=np.int16))
+
+        assert bytes(view) == np.arange(16, dtype=np.int16).tobytes()
 
     def test_stop_sets_flag(self):
         """Test stop sets running flag to False."""
@@ -122,8 +254,24 @@ class TestWebRTCGateway:
             gateway = WebRTCGateway()
 
             assert gateway._config is not None
+            assert gateway._config.turn_servers == ()
             assert gateway.active_connections == 0
 
+    def test_default_config_uses_turn_settings(self):
+        """Test the default config picks up the TURN server from settings."""
+        with patch("src.api.webrtc.gateway.get_settings") as mock_settings:
+            mock_settings.return_value.turn_url = "turn:turn.example.com:3478"
+            mock_settings.return_value.turn_username = "user"
+            mock_settings.return_value.turn_credential = "pass"
+
+            gateway = WebRTCGateway()
+
+        assert gateway._config.turn_servers == ({
+            "urls": "turn:turn.example.com:3478",
+            "username": "user",
+            "credential": "pass",
+        },)
+
     def test_creation_with_custom_config(self):
         """Test gateway creation with custom config."""
         config = WebRTCConfig(
@@ -179,6 +327,16 @@ class TestWebRTCGateway:
         assert "test-123" not in gateway._audio_callbacks
         mock_pc.close.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_close_unknown_session_noop(self):
+        """Test closing an unknown session does nothing and does not raise."""
+        config = WebRTCConfig()
+        gateway = WebRTCGateway(config)
+
+        await gateway.close_connection("unknown")
+
+        assert gateway.active_connections == 0
+
     @pytest.mark.asyncio
     async def test_close_all_closes_all_connections(self):
         """Test close_all closes all active connections."""
@@ -195,6 +353,60 @@ class TestWebRTCGateway:
 
         assert gateway.active_connections == 0
 
+    @pytest.mark.asyncio
+    async def test_close_all_closes_connections_concurrently(self):
+        """Test close_all overlaps the peer connection closes."""
+        config = WebRTCConfig()
+        gateway = WebRTCGateway(config)
+
+        n = 5
+        in_flight = 0
+        max_in_flight = 0
+        all_closing = asyncio.Event()
+
+        async def slow_close():
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            if in_flight == n:
+                all_closing.set()
+            # Serial closes would never get past this barrier
+            await asyncio.wait_for(all_closing.wait(), timeout=1.0)
+            in_flight -= 1
+
+        pcs = []
+        for i in range(n):
+            mock_pc = AsyncMock()
+            mock_pc.close = AsyncMock(side_effect=slow_close)
+            pcs.append(mock_pc)
+            gateway._connections[f"session-{i}"] = PeerConnectionState(
+                session_id=f"session-{i}", pc=mock_pc
+            )
+
+        await gateway.close_all()
+
+        assert gateway.active_connections == 0
+        assert max_in_flight == n
+        for mock_pc in pcs:
+            mock_pc.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_close_all_continues_past_close_errors(self):
+        """Test one failing close does not stop the others."""
+        config = WebRTCConfig()
+        gateway = WebRTCGateway(config)
+
+        failing_pc = AsyncMock()
+        failing_pc.close.side_effect = RuntimeError("boom")
+        ok_pc = AsyncMock()
+        gateway._connections["bad"] = PeerConnectionState(session_id="bad", pc=failing_pc)
+        gateway._connections["ok"] = PeerConnectionState(session_id="ok", pc=ok_pc)
+
+        await gateway.close_all()
+
+        assert gateway.active_connections == 0
+        ok_pc.close.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_send_blendshapes_returns_false_for_unknown_session(self):
         """Test send_blendshapes returns False for unknown session."""
@@ -251,6 +463,7 @@ class TestWebRTCGateway:
         mock_pc = AsyncMock()
         mock_channel = MagicMock()
         mock_channel.readyState = "open"
+        mock_channel.bufferedAmount = 0
         state = PeerConnectionState(
             session_id="test-123",
             pc=mock_pc,
@@ -264,7 +477,123 @@ class TestWebRTCGateway:
         assert result is True
         mock_channel.send.assert_called_once()
         sent_data = mock_channel.send.call_args[0][0]
-        assert json.loads(sent_data) == blendshapes
+        assert loads(sent_data) == blendshapes
+
+    @pytest.mark.asyncio
+    async def test_send_blendshapes_sends_text(self):
+        """Test frames go out as text data channel messages, not binary."""
+        gateway, mock_channel = self._open_channel_gateway(WebRTCConfig())
+
+        await gateway.send_blendshapes("test-123", {"jawOpen": 0.5})
+
+        sent_data = mock_channel.send.call_args[0][0]
+        assert isinstance(sent_data, str)
+        assert loads(sent_data) == {"jawOpen": 0.5}
+
+    def _open_channel_gateway(self, config: WebRTCConfig):
+        """Create a gateway with one session on an open mock data channel."""
+        gateway = WebRTCGateway(config)
+        mock_channel = MagicMock()
+        mock_channel.readyState = "open"
+        mock_channel.bufferedAmount = 0
+        gateway._connections["test-123"] = PeerConnectionState(
+            session_id="test-123",
+            pc=AsyncMock(),
+            data_channel=mock_channel,
+        )
+        return gateway, mock_channel
+
+    @pytest.mark.asyncio
+    async def test_send_blendshapes_drops_when_buffer_full(self):
+        """Test frames are dropped while the channel send buffer is backed up."""
+        gateway, mock_channel = self._open_channel_gateway(
+            WebRTCConfig(max_buffered_bytes=65536)
+        )
+        mock_channel.bufferedAmount = 1_000_000
+
+        result = await gateway.send_blendshapes("test-123", {"frame": 1})
+
+        assert result is False
+        mock_channel.send.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_send_blendshapes_resumes_when_buffer_drains(self):
+        """Test sending resumes once bufferedAmount falls below the limit."""
+        gateway, mock_channel = self._open_channel_gateway(
+            WebRTCConfig(max_buffered_bytes=65536)
+        )
+        mock_channel.bufferedAmount = 1_000_000
+        await gateway.send_blendshapes("test-123", {"frame": 1})
+
+        mock_channel.bufferedAmount = 1024
+        result = await gateway.send_blendshapes("test-123", {"frame": 2})
+
+        assert result is True
+        assert loads(mock_channel.send.call_args[0][0]) == {"frame": 2}
+
+    @pytest.mark.asyncio
+    async def test_send_blendshapes_batch_size_one_sends_immediately(self):
+        """Test batch size 1 sends each frame as its own message."""
+        gateway, mock_channel = self._open_channel_gateway(
+            WebRTCConfig(blendshape_batch_size=1)
+        )
+
+        for i in range(3):
+            assert await gateway.send_blendshapes("test-123", {"frame": i}) is True
+
+        assert mock_channel.send.call_count == 3
+        sent = [loads(c.args[0]) for c in mock_channel.send.call_args_list]
+        assert sent == [{"frame": 0}, {"frame": 1}, {"frame": 2}]
+
+    @pytest.mark.asyncio
+    async def test_send_blendshapes_flushes_full_batch(self):
+        """Test frames are aggregated into one message when the batch fills."""
+        gateway, mock_channel = self._open_channel_gateway(
+            WebRTCConfig(blendshape_batch_size=4, blendshape_flush_ms=1000.0)
+        )
+
+        for i in range(3):
+            assert await gateway.send_blendshapes("test-123", {"frame": i}) is True
+        mock_channel.send.assert_not_called()
+
+        assert await gateway.send_blendshapes("test-123", {"frame": 3}) is True
+
+        mock_channel.send.assert_called_once()
+        payload = loads(mock_channel.send.call_args[0][0])
+        assert payload == {"batch": [{"frame": i} for i in range(4)]}
+        assert "test-123" not in gateway._flush_handles
+
+    @pytest.mark.asyncio
+    async def test_batch_flush_after_deadline(self):
+        """Test a partial batch is flushed once the window elapses."""
+        gateway, mock_channel = self._open_channel_gateway(
+            WebRTCConfig(blendshape_batch_size=8, blendshape_flush_ms=5.0)
+        )
+
+        await gateway.send_blendshapes("test-123", {"frame": 0})
+        await gateway.send_blendshapes("test-123", {"frame": 1})
+        mock_channel.send.assert_not_called()
+
+        await asyncio.sleep(0.02)
+
+        mock_channel.send.assert_called_once()
+        payload = loads(mock_channel.send.call_args[0][0])
+        assert payload == {"batch": [{"frame": 0}, {"frame": 1}]}
+
+    @pytest.mark.asyncio
+    async def test_close_connection_drops_pending_batch(self):
+        """Test closing a session cancels its pending flush."""
+        gateway, mock_channel = self._open_channel_gateway(
+            WebRTCConfig(blendshape_batch_size=8, blendshape_flush_ms=5.0)
+        )
+
+        await gateway.send_blendshapes("test-123", {"frame": 0})
+        await gateway.close_connection("test-123")
+        await asyncio.sleep(0.02)
+
+        mock_channel.send.assert_not_called()
+        assert gateway._pending_blendshapes == {}
+        assert gateway._flush_handles == {}
 
     @pytest.mark.asyncio
     async def test_handle_ice_candidate_ignored_for_unknown_session(self):
@@ -301,42 +630,15 @@ class TestFactoryFunction:
 class TestWebRTCGatewayHandleOffer:
     """Tests for handle_offer method."""
 
-    def _create_mock_pc(self, answer_sdp: str = "answer"):
-        """Create a properly mocked RTCPeerConnection."""
-        mock_pc = MagicMock()
-        mock_pc.connectionState = "new"
-
-        # Mock async methods
-        mock_pc.setRemoteDescription = AsyncMock()
-        mock_pc.createAnswer = AsyncMock()
-        mock_pc.setLocalDescription = AsyncMock()
-        mock_pc.addIceCandidate = AsyncMock()
-        mock_pc.close = AsyncMock()
-
-        # Mock local description
-        mock_local_desc = MagicMock()
-        mock_local_desc.sdp = answer_sdp
-        mock_pc.localDescription = mock_local_desc
-
-        # Mock data channel with proper on decorator
-        mock_channel = MagicMock()
-        mock_channel.on = MagicMock(side_effect=lambda event: lambda fn: fn)
-        mock_pc.createDataChannel.return_value = mock_channel
-
-        # Mock on decorator to return identity function
-        mock_pc.on = MagicMock(side_effect=lambda event: lambda fn: fn)
-
-        return mock_pc
-
     @pytest.mark.asyncio
-    async def test_handle_offer_creates_answer(self):
+    async def test_handle_offer_creates_answer(self, mock_pc_factory):
         """Test handle_offer creates valid answer."""
         config = WebRTCConfig()
         gateway = WebRTCGateway(config)
 
         # Mock RTCPeerConnection
         with patch("src.api.webrtc.gateway.RTCPeerConnection") as mock_pc_class:
-            mock_pc = self._create_mock_pc("v=0\r\no=- 1234 answer\r\n")
+            mock_pc = mock_pc_factory("v=0\r\no=- 1234 answer\r\n")
             mock_pc_class.return_value = mock_pc
 
             offer_sdp = "v=0\r\no=- 1234 offer\r\n"
@@ -349,13 +651,13 @@ class TestWebRTCGatewayHandleOffer:
             mock_pc.setLocalDescription.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_handle_offer_creates_data_channel_when_enabled(self):
+    async def test_handle_offer_creates_data_channel_when_enabled(self, mock_pc_factory):
         """Test handle_offer creates data channel when enabled."""
         config = WebRTCConfig(enable_data_channel=True)
         gateway = WebRTCGateway(config)
 
         with patch("src.api.webrtc.gateway.RTCPeerConnection") as mock_pc_class:
-            mock_pc = self._create_mock_pc("answer")
+            mock_pc = mock_pc_factory("answer")
             mock_pc_class.return_value = mock_pc
 
             await gateway.handle_offer("session-123", "offer")
@@ -367,13 +669,13 @@ class TestWebRTCGatewayHandleOffer:
             )
 
     @pytest.mark.asyncio
-    async def test_handle_offer_skips_data_channel_when_disabled(self):
+    async def test_handle_offer_skips_data_channel_when_disabled(self, mock_pc_factory):
         """Test handle_offer skips data channel when disabled."""
         config = WebRTCConfig(enable_data_channel=False)
         gateway = WebRTCGateway(config)
 
         with patch("src.api.webrtc.gateway.RTCPeerConnection") as mock_pc_class:
-            mock_pc = self._create_mock_pc("answer")
+            mock_pc = mock_pc_factory("answer")
             mock_pc_class.return_value = mock_pc
 
             await gateway.handle_offer("session-123", "offer")
@@ -381,45 +683,144 @@ class TestWebRTCGatewayHandleOffer:
             mock_pc.createDataChannel.assert_not_called()
 
 
-class TestWebRTCGatewayIntegration:
-    """Integration-style tests for WebRTC gateway."""
+    @pytest.mark.asyncio
+    async def test_reuses_rtc_configuration(self, mock_pc_factory):
+        """Test every peer connection shares the prebuilt RTCConfiguration."""
+        config = WebRTCConfig()
+        gateway = WebRTCGateway(config)
 
-    def _create_mock_pc(self, answer_sdp: str = "answer"):
-        """Create a properly mocked RTCPeerConnection."""
-        mock_pc = MagicMock()
-        mock_pc.connectionState = "new"
+        with patch("src.api.webrtc.gateway.RTCPeerConnection") as mock_pc_class:
+            mock_pc_class.side_effect = [mock_pc_factory(), mock_pc_factory()]
 
-        # Mock async methods
-        mock_pc.setRemoteDescription = AsyncMock()
-        mock_pc.createAnswer = AsyncMock()
-        mock_pc.setLocalDescription = AsyncMock()
-        mock_pc.addIceCandidate = AsyncMock()
-        mock_pc.close = AsyncMock()
+            await gateway.handle_offer("session-1", "offer")
+            await gateway.handle_offer("session-2", "offer")
 
-        # Mock local description
-        mock_local_desc = MagicMock()
-        mock_local_desc.sdp = answer_sdp
-        mock_pc.localDescription = mock_local_desc
+        first, second = mock_pc_class.call_args_list
+        assert first.kwargs["configuration"] is gateway._rtc_configuration
+        assert second.kwargs["configuration"] is gateway._rtc_configuration
 
-        # Mock data channel with proper on decorator and readyState
-        mock_channel = MagicMock()
-        mock_channel.on = MagicMock(side_effect=lambda event: lambda fn: fn)
-        mock_channel.readyState = "open"
-        mock_pc.createDataChannel.return_value = mock_channel
+    @pytest.mark.asyncio
+    async def test_handle_offers_batch_parallel(self, mock_pc_factory):
+        """Test batched offers are negotiated concurrently."""
+        config = WebRTCConfig()
+        gateway = WebRTCGateway(config)
 
-        # Mock on decorator to return identity function
-        mock_pc.on = MagicMock(side_effect=lambda event: lambda fn: fn)
+        n = 3
+        in_flight = 0
+        all_in_flight = asyncio.Event()
 
-        return mock_pc
+        async def slow_remote_description(offer):
+            nonlocal in_flight
+            in_flight += 1
+            if in_flight == n:
+                all_in_flight.set()
+            # Released only once every handshake is inside setRemoteDescription
+            await asyncio.wait_for(all_in_flight.wait(), timeout=1.0)
+
+        mock_pcs = [mock_pc_factory(f"answer-{i}") for i in range(n)]
+        for mock_pc in mock_pcs:
+            mock_pc.setRemoteDescription = AsyncMock(side_effect=slow_remote_description)
+
+        with patch("src.api.webrtc.gateway.RTCPeerConnection") as mock_pc_class:
+            mock_pc_class.side_effect = mock_pcs
+
+            answers = await gateway.handle_offers_batch(
+                [(f"session-{i}", f"offer-{i}") for i in range(n)]
+            )
+
+        assert answers == ["answer-0", "answer-1", "answer-2"]
+        assert gateway.active_connections == n
+
+    @pytest.mark.asyncio
+    async def test_handle_offers_batch_returns_exceptions(self, mock_pc_factory):
+        """Test a failed handshake does not abort the rest of the batch."""
+        config = WebRTCConfig()
+        gateway = WebRTCGateway(config)
+
+        bad_pc = mock_pc_factory("unused")
+        bad_pc.setRemoteDescription = AsyncMock(side_effect=ValueError("bad sdp"))
+        good_pc = mock_pc_factory("answer")
+
+        with patch("src.api.webrtc.gateway.RTCPeerConnection") as mock_pc_class:
+            mock_pc_class.side_effect = [bad_pc, good_pc]
+
+            answers = await gateway.handle_offers_batch(
+                [("bad", "offer"), ("good", "offer")]
+            )
+
+        assert isinstance(answers[0], ValueError)
+        assert answers[1] == "answer"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_offers_same_session_serialized(self, mock_pc_factory):
+        """Test concurrent offers for one session negotiate one at a time."""
+        config = WebRTCConfig()
+        gateway = WebRTCGateway(config)
+        events = []
+
+        def tracked_pc(name):
+            mock_pc = mock_pc_factory(f"answer-{name}")
+
+            async def remote(offer):
+                events.append(f"{name}:remote")
+                await asyncio.sleep(0.01)
+
+            async def local(answer):
+                events.append(f"{name}:local")
+
+            async def close():
+                events.append(f"{name}:close")
+
+            mock_pc.setRemoteDescription = AsyncMock(side_effect=remote)
+            mock_pc.setLocalDescription = AsyncMock(side_effect=local)
+            mock_pc.close = AsyncMock(side_effect=close)
+            return mock_pc
+
+        first, second = tracked_pc("a"), tracked_pc("b")
+
+        with patch("src.api.webrtc.gateway.RTCPeerConnection") as mock_pc_class:
+            mock_pc_class.side_effect = [first, second]
+
+            answers = await asyncio.gather(
+                gateway.handle_offer("sid-x", "offer-1"),
+                gateway.handle_offer("sid-x", "offer-2"),
+            )
+
+        assert answers == ["answer-a", "answer-b"]
+        # Second negotiation starts only after the first completes, then replaces it
+        assert events == ["a:remote", "a:local", "a:close", "b:remote", "b:local"]
+        assert gateway.active_connections == 1
+        assert gateway._connections["sid-x"].pc is second
+
+    @pytest.mark.asyncio
+    async def test_session_locks_released_after_use(self, mock_pc_factory):
+        """Test per-session locks do not accumulate."""
+        import gc
+
+        config = WebRTCConfig()
+        gateway = WebRTCGateway(config)
+
+        with patch("src.api.webrtc.gateway.RTCPeerConnection") as mock_pc_class:
+            mock_pc_class.side_effect = [mock_pc_factory() for _ in range(5)]
+            for i in range(5):
+                await gateway.handle_offer(f"session-{i}", "offer")
+                await gateway.close_connection(f"session-{i}")
+
+        gc.collect()
+        assert len(gateway._session_locks) == 0
+
+
+class TestWebRTCGatewayIntegration:
+    """Integration-style tests for WebRTC gateway."""
 
     @pytest.mark.asyncio
-    async def test_full_connection_lifecycle(self):
+    async def test_full_connection_lifecycle(self, mock_pc_factory):
         """Test complete connection lifecycle: create, use, close."""
         config = WebRTCConfig()
         gateway = WebRTCGateway(config)
 
         with patch("src.api.webrtc.gateway.RTCPeerConnection") as mock_pc_class:
-            mock_pc = self._create_mock_pc("answer")
+            mock_pc = mock_pc_factory("answer")
             mock_pc_class.return_value = mock_pc
 
             # Step 1: Handle offer
@@ -436,13 +837,13 @@ class TestWebRTCGatewayIntegration:
             assert gateway.active_connections == 0
 
     @pytest.mark.asyncio
-    async def test_multiple_concurrent_sessions(self):
+    async def test_multiple_concurrent_sessions(self, mock_pc_factory):
         """Test gateway handles multiple concurrent sessions."""
         config = WebRTCConfig()
         gateway = WebRTCGateway(config)
 
         with patch("src.api.webrtc.gateway.RTCPeerConnection") as mock_pc_class:
-            mock_pcs = [self._create_mock_pc(f"answer-{i}") for i in range(3)]
+            mock_pcs = [mock_pc_factory(f"answer-{i}") for i in range(3)]
             mock_pc_class.side_effect = mock_pcs
 
             # Create 3 connections
@@ -1,8 +1,13 @@
 """Tests for WebSocket Retry utilities."""
 
 import asyncio
+import random
+from dataclasses import dataclass, fields
+from functools import partial
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+import pytest_asyncio
+from unittest.mock import AsyncMock
 
 from src.utils.websocket_retry import (
     RetryConfig,
@@ -11,39 +16,129 @@ from src.utils.websocket_retry import (
     ReconnectingWebSocket,
 )
 
+# RetryConfig is frozen, so hot tests share these instead of rebuilding them
+_FAST_CFG = RetryConfig(max_retries=3, initial_delay_s=0.01, jitter=False)
+_JITTER_CFG = RetryConfig(max_retries=2, initial_delay_s=1.0, jitter=True)
+_ONE_SHOT_CFG = RetryConfig(max_retries=1, initial_delay_s=0.01, jitter=False)
+
+# Expected backoff schedules: 1.0 doubling, and 5.0 doubling capped at 8.0
+EXPECTED_EXP = (1.0, 2.0)
+EXPECTED_CAP = (5.0, 8.0)
+
+
+class FakeWS:
+    """Minimal WebSocket stand-in that only records close() calls."""
+
+    def __init__(self, close_error=None):
+        self.close_called = 0
+        self._close_error = close_error
+
+    async def close(self):
+        self.close_called += 1
+        if self._close_error is not None:
+            raise self._close_error
+
+
+async def fake_connect(ws=None):
+    """Connect function returning the given (or a new) FakeWS."""
+    return ws or FakeWS()
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def no_leaked_tasks():
+    """Fail a test that leaves tasks running on the shared module loop."""
+    yield
+    current = asyncio.current_task()
+    leaked = [t for t in asyncio.all_tasks() if t is not current and not t.done()]
+    assert not leaked, f"test left tasks running: {leaked}"
+
+
+# ReconnectingWebSocket tests share one module-scoped loop instead of
+# building and closing a fresh loop per test
+SHARED_LOOP = [pytest.mark.asyncio(loop_scope="module"), pytest.mark.usefixtures("no_leaked_tasks")]
+
+
+@pytest.fixture
+def fake_sleep():
+    """Recorder passed as with_retry(sleep=...) in place of asyncio.sleep.
+
+    Retry tests then finish in microseconds whatever delays they configure;
+    recorded delays are available as fake_sleep.delays.
+    """
+
+    async def recorder(delay):
+        recorder.delays.append(delay)
+
+    recorder.delays = []
+    return recorder
+
 
 class TestRetryConfig:
     """Tests for RetryConfig dataclass."""
 
-    def test_defaults(self):
-        """Test default configuration values."""
-        config = RetryConfig()
-        assert config.max_retries == 3
-        assert config.initial_delay_s == 0.5
-        assert config.max_delay_s == 10.0
-        assert config.backoff_factor == 2.0
-        assert config.jitter is True
-
-    def test_custom_values(self):
-        """Test custom configuration values."""
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            (
+                {},
+                {
+                    "max_retries": 3,
+                    "initial_delay_s": 0.5,
+                    "max_delay_s": 10.0,
+                    "backoff_factor": 2.0,
+                    "jitter": True,
+                },
+            ),
+            (
+                {
+                    "max_retries": 5,
+                    "initial_delay_s": 1.0,
+                    "max_delay_s": 30.0,
+                    "backoff_factor": 3.0,
+                    "jitter": False,
+                },
+                {
+                    "max_retries": 5,
+                    "initial_delay_s": 1.0,
+                    "max_delay_s": 30.0,
+                    "backoff_factor": 3.0,
+                    "jitter": False,
+                },
+            ),
+        ],
+        ids=["defaults", "custom"],
+    )
+    def test_config_values(self, kwargs, expected):
+        """Configuration values match defaults or the given overrides."""
+        config = RetryConfig(**kwargs)
+        # asdict() would also include the derived _delays schedule
+        values = {f.name: getattr(config, f.name) for f in fields(config) if f.init}
+        assert values == expected
+
+    def test_delay_schedule_cached(self):
+        """Backoff delays are precomputed once per config."""
+        config = RetryConfig(max_retries=4, initial_delay_s=1.0, backoff_factor=2.0)
+        assert config._delays == (1.0, 2.0, 4.0)
+
+    def test_delay_schedule_capped(self):
+        """Precomputed delays respect max_delay_s."""
         config = RetryConfig(
-            max_retries=5,
-            initial_delay_s=1.0,
-            max_delay_s=30.0,
-            backoff_factor=3.0,
-            jitter=False,
+            max_retries=5, initial_delay_s=3.0, max_delay_s=8.0, backoff_factor=2.0
         )
-        assert config.max_retries == 5
-        assert config.initial_delay_s == 1.0
-        assert config.max_delay_s == 30.0
-        assert config.backoff_factor == 3.0
-        assert config.jitter is False
+        assert config._delays == (3.0, 6.0, 8.0, 8.0)
+
+    def test_config_is_immutable(self):
+        """Configs cannot be mutated, so the schedule cannot go stale."""
+        import dataclasses
+
+        config = RetryConfig()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.max_retries = 10
 
 
 class TestWithRetry:
     """Tests for with_retry function."""
 
-    @pytest.mark.asyncio
     async def test_success_first_attempt(self):
         """Test successful connection on first attempt."""
         mock_connect = AsyncMock(return_value="connection")
@@ -53,8 +148,7 @@ class TestWithRetry:
         assert result == "connection"
         assert mock_connect.call_count == 1
 
-    @pytest.mark.asyncio
-    async def test_success_after_retries(self):
+    async def test_success_after_retries(self, fake_sleep):
         """Test successful connection after retries."""
         mock_connect = AsyncMock(
             side_effect=[
@@ -63,45 +157,36 @@ class TestWithRetry:
                 "connection",
             ]
         )
-        config = RetryConfig(max_retries=3, initial_delay_s=0.01, jitter=False)
+        config = _FAST_CFG
 
-        result = await with_retry(mock_connect, config=config)
+        result = await with_retry(mock_connect, config=config, sleep=fake_sleep)
 
         assert result == "connection"
         assert mock_connect.call_count == 3
 
-    @pytest.mark.asyncio
-    async def test_exhausted_retries(self):
+    async def test_exhausted_retries(self, fake_sleep):
         """Test RetryExhausted raised when all retries fail."""
         mock_connect = AsyncMock(side_effect=ConnectionError("Always fails"))
-        config = RetryConfig(max_retries=3, initial_delay_s=0.01, jitter=False)
+        config = _FAST_CFG
 
         with pytest.raises(RetryExhausted) as exc_info:
-            await with_retry(mock_connect, config=config)
+            await with_retry(mock_connect, config=config, sleep=fake_sleep)
 
         assert exc_info.value.attempts == 3
         assert isinstance(exc_info.value.last_error, ConnectionError)
 
-    @pytest.mark.asyncio
-    async def test_cancelled_error_not_retried(self):
+    async def test_cancelled_error_not_retried(self, fake_sleep):
         """Test CancelledError is not retried."""
         mock_connect = AsyncMock(side_effect=asyncio.CancelledError())
-        config = RetryConfig(max_retries=3, initial_delay_s=0.01)
+        config = _FAST_CFG
 
         with pytest.raises(asyncio.CancelledError):
-            await with_retry(mock_connect, config=config)
+            await with_retry(mock_connect, config=config, sleep=fake_sleep)
 
         assert mock_connect.call_count == 1
 
-    @pytest.mark.asyncio
-    async def test_exponential_backoff(self):
+    async def test_exponential_backoff(self, fake_sleep):
         """Test exponential backoff increases delay."""
-        delays = []
-        original_sleep = asyncio.sleep
-
-        async def mock_sleep(delay):
-            delays.append(delay)
-
         mock_connect = AsyncMock(
             side_effect=[
                 ConnectionError("Fail 1"),
@@ -116,117 +201,88 @@ class TestWithRetry:
             jitter=False,
         )
 
-        # Patch sleep to capture delays
-        asyncio.sleep = mock_sleep
-        try:
-            with pytest.raises(RetryExhausted):
-                await with_retry(mock_connect, config=config)
-        finally:
-            asyncio.sleep = original_sleep
+        with pytest.raises(RetryExhausted):
+            await with_retry(mock_connect, config=config, sleep=fake_sleep)
 
-        # Should have delays of 1.0, 2.0 (exponential backoff)
-        assert len(delays) == 2
-        assert delays[0] == 1.0
-        assert delays[1] == 2.0
+        assert tuple(fake_sleep.delays) == EXPECTED_EXP
 
 
 class TestReconnectingWebSocket:
     """Tests for ReconnectingWebSocket class."""
 
-    @pytest.mark.asyncio
+    pytestmark = SHARED_LOOP
+
     async def test_start_success(self):
         """Test successful start."""
-        mock_ws = MagicMock()
-        mock_connect = AsyncMock(return_value=mock_ws)
+        ws = FakeWS()
 
-        rws = ReconnectingWebSocket(mock_connect, session_id="test-123")
+        rws = ReconnectingWebSocket(partial(fake_connect, ws), session_id="test-123")
         await rws.start()
 
         assert rws.is_connected
-        assert rws.connection is mock_ws
+        assert rws.connection is ws
 
-    @pytest.mark.asyncio
     async def test_stop_closes_connection(self):
         """Test stop closes connection."""
-        mock_ws = AsyncMock()
-        mock_connect = AsyncMock(return_value=mock_ws)
+        ws = FakeWS()
 
-        rws = ReconnectingWebSocket(mock_connect, session_id="test-123")
+        rws = ReconnectingWebSocket(partial(fake_connect, ws), session_id="test-123")
         await rws.start()
         await rws.stop()
 
         assert not rws.is_connected
-        mock_ws.close.assert_called_once()
+        assert ws.close_called == 1
 
-    @pytest.mark.asyncio
     async def test_on_connect_callback(self):
         """Test on_connect callback is called."""
-        mock_ws = MagicMock()
-        mock_connect = AsyncMock(return_value=mock_ws)
-        on_connect = AsyncMock()
+        calls = []
+
+        async def on_connect():
+            calls.append("connect")
 
         rws = ReconnectingWebSocket(
-            mock_connect,
+            fake_connect,
             session_id="test-123",
             on_connect=on_connect,
         )
         await rws.start()
 
-        on_connect.assert_called_once()
+        assert calls == ["connect"]
 
-    @pytest.mark.asyncio
     async def test_on_disconnect_callback(self):
         """Test on_disconnect callback is called."""
-        mock_ws = AsyncMock()
-        mock_connect = AsyncMock(return_value=mock_ws)
-        on_disconnect = AsyncMock()
+        calls = []
+
+        async def on_disconnect():
+            calls.append("disconnect")
 
         rws = ReconnectingWebSocket(
-            mock_connect,
+            fake_connect,
             session_id="test-123",
             on_disconnect=on_disconnect,
         )
         await rws.start()
         await rws.stop()
 
-        on_disconnect.assert_called_once()
+        assert calls == ["disconnect"]
 
-    @pytest.mark.asyncio
     async def test_reconnect_success(self):
         """Test successful reconnect."""
-        mock_ws1 = MagicMock()
-        mock_ws2 = MagicMock()
-        call_count = 0
-
-        async def mock_connect():
-            nonlocal call_count
-            call_count += 1
-            return mock_ws1 if call_count == 1 else mock_ws2
+        ws1, ws2 = FakeWS(), FakeWS()
+        connections = iter([ws1, ws2])
 
         rws = ReconnectingWebSocket(
-            mock_connect,
+            lambda: fake_connect(next(connections)),
             session_id="test-123",
-            retry_config=RetryConfig(max_retries=1, initial_delay_s=0.01),
+            retry_config=_ONE_SHOT_CFG,
         )
         await rws.start()
-        assert rws.connection is mock_ws1
+        assert rws.connection is ws1
 
         success = await rws.reconnect()
 
         assert success
-        assert rws.connection is mock_ws2
-
-    @pytest.mark.asyncio
-    async def test_reconnect_when_not_running(self):
-        """Test reconnect returns False when not running."""
-        mock_connect = AsyncMock(return_value=MagicMock())
-
-        rws = ReconnectingWebSocket(mock_connect, session_id="test-123")
-        # Don't start - _running is False
-
-        success = await rws.reconnect()
-
-        assert not success
+        assert rws.connection is ws2
 
 
 class TestRetryExhausted:
@@ -252,46 +308,32 @@ class TestRetryExhausted:
 class TestWithRetryJitter:
     """Tests for jitter behavior in with_retry."""
 
-    @pytest.mark.asyncio
-    async def test_jitter_varies_delay(self):
+    async def test_jitter_varies_delay(self, fake_sleep):
         """Jitter varies the actual delay."""
-        from unittest.mock import patch
-
-        delays = []
-        original_sleep = asyncio.sleep
-
-        async def mock_sleep(delay):
-            delays.append(delay)
-
         mock_connect = AsyncMock(
             side_effect=[ConnectionError("fail"), "conn"]
         )
-        config = RetryConfig(
-            max_retries=2,
-            initial_delay_s=1.0,
-            jitter=True,
-        )
+        config = _JITTER_CFG
 
-        asyncio.sleep = mock_sleep
-        try:
-            with patch("random.random", return_value=0.25):
-                await with_retry(mock_connect, config=config)
-        finally:
-            asyncio.sleep = original_sleep
+        await with_retry(mock_connect, config=config, sleep=fake_sleep, rng=random.Random(0))
 
-        # Delay should be 1.0 * (0.5 + 0.25) = 0.75
-        assert len(delays) == 1
-        assert delays[0] == 0.75
+        # Delay should be 1.0 * (0.5 + first draw of the same seeded RNG)
+        assert fake_sleep.delays == [1.0 * (0.5 + random.Random(0).random())]
 
-    @pytest.mark.asyncio
-    async def test_max_delay_caps_backoff(self):
-        """Max delay caps exponential backoff."""
-        delays = []
-        original_sleep = asyncio.sleep
+    async def test_jitter_bounded(self, fake_sleep):
+        """Jittered delays stay within [0.5, 1.5) x the base delay."""
+        config = _JITTER_CFG
+        rng = random.Random(1234)
 
-        async def mock_sleep(delay):
-            delays.append(delay)
+        for _ in range(1000):
+            mock_connect = AsyncMock(side_effect=[ConnectionError(), "conn"])
+            await with_retry(mock_connect, config=config, sleep=fake_sleep, rng=rng)
 
+        assert len(fake_sleep.delays) == 1000
+        assert all(0.5 <= d < 1.5 for d in fake_sleep.delays)
+
+    async def test_max_delay_caps_backoff(self, fake_sleep):
+        """Max delay caps exponential backoff."""
         mock_connect = AsyncMock(
             side_effect=[ConnectionError(), ConnectionError(), ConnectionError()]
         )
@@ -303,22 +345,15 @@ class TestWithRetryJitter:
             jitter=False,
         )
 
-        asyncio.sleep = mock_sleep
-        try:
-            with pytest.raises(RetryExhausted):
-                await with_retry(mock_connect, config=config)
-        finally:
-            asyncio.sleep = original_sleep
+        with pytest.raises(RetryExhausted):
+            await with_retry(mock_connect, config=config, sleep=fake_sleep)
 
-        # First delay: 5.0, second delay: 8.0 (capped at max_delay_s)
-        assert delays[0] == 5.0
-        assert delays[1] == 8.0
+        assert tuple(fake_sleep.delays) == EXPECTED_CAP
 
 
 class TestWithRetryLogging:
     """Tests for logging in with_retry."""
 
-    @pytest.mark.asyncio
     async def test_operation_name_and_session_id(self):
         """Operation name and session ID used for logging."""
         mock_connect = AsyncMock(return_value="conn")
@@ -331,7 +366,6 @@ class TestWithRetryLogging:
 
         assert result == "conn"
 
-    @pytest.mark.asyncio
     async def test_default_config_used(self):
         """Default config used when none provided."""
         mock_connect = AsyncMock(return_value="conn")
@@ -346,8 +380,7 @@ class TestReconnectingWebSocketInit:
 
     def test_init_default_config(self):
         """Initialize with default config."""
-        connect_fn = AsyncMock()
-        rws = ReconnectingWebSocket(connect_fn)
+        rws = ReconnectingWebSocket(fake_connect)
 
         assert rws._retry_config.max_retries == 3
         assert rws._session_id is None
@@ -356,11 +389,10 @@ class TestReconnectingWebSocketInit:
 
     def test_init_custom_config(self):
         """Initialize with custom config."""
-        connect_fn = AsyncMock()
         config = RetryConfig(max_retries=10)
 
         rws = ReconnectingWebSocket(
-            connect_fn,
+            fake_connect,
             session_id="test-session",
             retry_config=config,
         )
@@ -374,91 +406,114 @@ class TestReconnectingWebSocketProperties:
 
     def test_connection_property(self):
         """connection property returns current connection."""
-        connect_fn = AsyncMock()
-        rws = ReconnectingWebSocket(connect_fn)
+        rws = ReconnectingWebSocket(fake_connect)
 
         assert rws.connection is None
 
-        mock_ws = MagicMock()
-        rws._connection = mock_ws
+        ws = FakeWS()
+        rws._connection = ws
+
+        assert rws.connection is ws
+
+    @pytest.mark.parametrize(
+        "running,connection,expected",
+        [
+            (False, None, False),
+            (False, FakeWS(), False),
+            (True, None, False),
+            (True, FakeWS(), True),
+        ],
+        ids=["initial", "stopped", "no_connection", "connected"],
+    )
+    def test_is_connected(self, running, connection, expected):
+        """is_connected requires both a running loop and a connection."""
+        rws = ReconnectingWebSocket(fake_connect)
+        rws._running = running
+        rws._connection = connection
+
+        assert rws.is_connected is expected
 
-        assert rws.connection is mock_ws
 
-    def test_is_connected_false_initially(self):
-        """is_connected is False before start."""
-        connect_fn = AsyncMock()
-        rws = ReconnectingWebSocket(connect_fn)
+class TestReconnectingWebSocketWaitConnected:
+    """Tests for ReconnectingWebSocket.wait_connected."""
 
-        assert rws.is_connected is False
+    pytestmark = SHARED_LOOP
 
-    def test_is_connected_false_without_running(self):
-        """is_connected is False when not running."""
-        connect_fn = AsyncMock()
-        rws = ReconnectingWebSocket(connect_fn)
-        rws._connection = MagicMock()
-        rws._running = False
+    async def test_wait_connected_wakes_on_start(self):
+        """wait_connected() returns once start() connects."""
+        rws = ReconnectingWebSocket(fake_connect)
 
-        assert rws.is_connected is False
+        waiter = asyncio.create_task(rws.wait_connected())
+        await asyncio.sleep(0)
+        assert not waiter.done()
 
-    def test_is_connected_true_when_running(self):
-        """is_connected is True when running with connection."""
-        connect_fn = AsyncMock()
-        rws = ReconnectingWebSocket(connect_fn)
-        rws._connection = MagicMock()
-        rws._running = True
+        await rws.start()
+
+        assert await asyncio.wait_for(waiter, timeout=1.0) is True
+
+    async def test_wait_connected_times_out(self):
+        """wait_connected() returns False when no connection arrives."""
+        rws = ReconnectingWebSocket(fake_connect)
+
+        assert await rws.wait_connected(timeout=0.01) is False
+
+    async def test_stop_clears_connected(self):
+        """After stop(), waiters block until the next connection."""
+        rws = ReconnectingWebSocket(fake_connect)
 
-        assert rws.is_connected is True
+        await rws.start()
+        assert await rws.wait_connected(timeout=0.01) is True
+
+        await rws.stop()
+        assert await rws.wait_connected(timeout=0.01) is False
 
 
 class TestReconnectingWebSocketCallbacks:
     """Tests for ReconnectingWebSocket callback handling."""
 
-    @pytest.mark.asyncio
+    pytestmark = SHARED_LOOP
+
     async def test_sync_on_connect_callback(self):
         """Sync on_connect callback is called."""
-        mock_ws = MagicMock()
-        connect_fn = AsyncMock(return_value=mock_ws)
-        on_connect = MagicMock()
+        calls = []
 
-        rws = ReconnectingWebSocket(connect_fn, on_connect=on_connect)
+        rws = ReconnectingWebSocket(fake_connect, on_connect=lambda: calls.append("connect"))
         await rws.start()
 
-        on_connect.assert_called_once()
+        assert calls == ["connect"]
 
-    @pytest.mark.asyncio
     async def test_sync_on_disconnect_callback(self):
         """Sync on_disconnect callback is called."""
-        mock_ws = AsyncMock()
-        connect_fn = AsyncMock(return_value=mock_ws)
-        on_disconnect = MagicMock()
+        calls = []
 
-        rws = ReconnectingWebSocket(connect_fn, on_disconnect=on_disconnect)
+        rws = ReconnectingWebSocket(
+            fake_connect, on_disconnect=lambda: calls.append("disconnect")
+        )
         await rws.start()
         await rws.stop()
 
-        on_disconnect.assert_called_once()
+        assert calls == ["disconnect"]
 
-    @pytest.mark.asyncio
     async def test_on_connect_error_handled(self):
         """on_connect errors are handled gracefully."""
-        mock_ws = MagicMock()
-        connect_fn = AsyncMock(return_value=mock_ws)
-        on_connect = MagicMock(side_effect=ValueError("callback error"))
+        ws = FakeWS()
+
+        def on_connect():
+            raise ValueError("callback error")
 
-        rws = ReconnectingWebSocket(connect_fn, on_connect=on_connect)
+        rws = ReconnectingWebSocket(partial(fake_connect, ws), on_connect=on_connect)
         # Should not raise
         await rws.start()
 
-        assert rws._connection is mock_ws
+        assert rws._connection is ws
 
-    @pytest.mark.asyncio
     async def test_on_disconnect_error_handled(self):
         """on_disconnect errors are handled gracefully."""
-        mock_ws = AsyncMock()
-        connect_fn = AsyncMock(return_value=mock_ws)
-        on_disconnect = MagicMock(side_effect=ValueError("callback error"))
 
-        rws = ReconnectingWebSocket(connect_fn, on_disconnect=on_disconnect)
+        def on_disconnect():
+            raise ValueError("callback error")
+
+        rws = ReconnectingWebSocket(fake_connect, on_disconnect=on_disconnect)
         await rws.start()
         # Should not raise
         await rws.stop()
@@ -469,26 +524,24 @@ class TestReconnectingWebSocketCallbacks:
 class TestReconnectingWebSocketLifecycle:
     """Tests for ReconnectingWebSocket lifecycle."""
 
-    @pytest.mark.asyncio
+    pytestmark = SHARED_LOOP
+
     async def test_stop_clears_state(self):
         """stop() clears all state."""
-        mock_ws = AsyncMock()
-        connect_fn = AsyncMock(return_value=mock_ws)
-        rws = ReconnectingWebSocket(connect_fn)
+        ws = FakeWS()
+        rws = ReconnectingWebSocket(partial(fake_connect, ws))
 
         await rws.start()
         await rws.stop()
 
         assert rws._running is False
         assert rws._connection is None
+        assert ws.close_called == 1
 
-    @pytest.mark.asyncio
     async def test_stop_handles_close_error(self):
         """stop() handles close errors gracefully."""
-        mock_ws = AsyncMock()
-        mock_ws.close.side_effect = Exception("close error")
-        connect_fn = AsyncMock(return_value=mock_ws)
-        rws = ReconnectingWebSocket(connect_fn)
+        ws = FakeWS(close_error=Exception("close error"))
+        rws = ReconnectingWebSocket(partial(fake_connect, ws))
 
         await rws.start()
         # Should not raise
@@ -496,12 +549,9 @@ class TestReconnectingWebSocketLifecycle:
 
         assert rws._connection is None
 
-    @pytest.mark.asyncio
     async def test_stop_cancels_monitor_task(self):
         """stop() cancels monitor task."""
-        mock_ws = AsyncMock()
-        connect_fn = AsyncMock(return_value=mock_ws)
-        rws = ReconnectingWebSocket(connect_fn)
+        rws = ReconnectingWebSocket(fake_connect)
 
         await rws.start()
 
@@ -516,80 +566,68 @@ class TestReconnectingWebSocketLifecycle:
         assert rws._monitor_task.cancelled() or rws._monitor_task.done()
 
 
-class TestReconnectingWebSocketReconnect:
-    """Tests for ReconnectingWebSocket reconnect."""
-
-    @pytest.mark.asyncio
-    async def test_reconnect_calls_on_connect(self):
-        """reconnect() calls on_connect callback."""
-        mock_ws1 = AsyncMock()
-        mock_ws2 = AsyncMock()
-        connect_fn = AsyncMock(side_effect=[mock_ws1, mock_ws2])
-        on_connect = MagicMock()
-
-        rws = ReconnectingWebSocket(connect_fn, on_connect=on_connect)
-        await rws.start()
-        on_connect.reset_mock()
-
-        await rws.reconnect()
-
-        on_connect.assert_called_once()
+@dataclass(frozen=True)
+class ReconnectCase:
+    """One row of the reconnect() behaviour table."""
 
-    @pytest.mark.asyncio
-    async def test_reconnect_handles_on_connect_error(self):
-        """reconnect() handles on_connect errors gracefully."""
-        mock_ws1 = AsyncMock()
-        mock_ws2 = AsyncMock()
-        connect_fn = AsyncMock(side_effect=[mock_ws1, mock_ws2])
-        on_connect = MagicMock(side_effect=[None, ValueError("error")])
+    name: str
+    started: bool = True
+    reconnect_fails: bool = False
+    on_connect_fails: bool = False
+    close_fails: bool = False
+    expect_result: bool = True
 
-        rws = ReconnectingWebSocket(connect_fn, on_connect=on_connect)
-        await rws.start()
 
-        # Should not raise
-        result = await rws.reconnect()
+RECONNECT_CASES = [
+    ReconnectCase("calls_on_connect"),
+    ReconnectCase("handles_on_connect_error", on_connect_fails=True),
+    ReconnectCase("failure", reconnect_fails=True, expect_result=False),
+    ReconnectCase("closes_old_connection"),
+    ReconnectCase("handles_close_error", close_fails=True),
+    ReconnectCase("not_running", started=False, expect_result=False),
+]
 
-        assert result is True
-        assert rws._connection is mock_ws2
 
-    @pytest.mark.asyncio
-    async def test_reconnect_failure(self):
-        """reconnect() returns False on failure."""
-        mock_ws = AsyncMock()
-        connect_fn = AsyncMock(side_effect=[mock_ws, ConnectionError("fail")])
-        config = RetryConfig(max_retries=1, initial_delay_s=0.01, jitter=False)
-        rws = ReconnectingWebSocket(connect_fn, retry_config=config)
+class TestReconnectingWebSocketReconnect:
+    """Tests for ReconnectingWebSocket reconnect."""
 
-        await rws.start()
-        result = await rws.reconnect()
+    pytestmark = SHARED_LOOP
 
-        assert result is False
+    @pytest.mark.parametrize("case", RECONNECT_CASES, ids=lambda c: c.name)
+    async def test_reconnect(self, case):
+        """reconnect() swaps connections and tolerates callback/close errors."""
+        old_ws = FakeWS(close_error=Exception("close failed") if case.close_fails else None)
+        new_ws = FakeWS()
+        results = iter([old_ws, ConnectionError("fail") if case.reconnect_fails else new_ws])
 
-    @pytest.mark.asyncio
-    async def test_reconnect_closes_old_connection(self):
-        """reconnect() closes old connection before reconnecting."""
-        mock_ws1 = AsyncMock()
-        mock_ws2 = AsyncMock()
-        connect_fn = AsyncMock(side_effect=[mock_ws1, mock_ws2])
-        rws = ReconnectingWebSocket(connect_fn)
+        async def connect_fn():
+            result = next(results)
+            if isinstance(result, Exception):
+                raise result
+            return result
 
-        await rws.start()
-        await rws.reconnect()
+        connects = []
 
-        mock_ws1.close.assert_awaited_once()
+        def on_connect():
+            connects.append(rws.connection)
+            if case.on_connect_fails and len(connects) > 1:
+                raise ValueError("error")
 
-    @pytest.mark.asyncio
-    async def test_reconnect_handles_close_error(self):
-        """reconnect() handles close error on old connection."""
-        mock_ws1 = AsyncMock()
-        mock_ws1.close.side_effect = Exception("close failed")
-        mock_ws2 = AsyncMock()
-        connect_fn = AsyncMock(side_effect=[mock_ws1, mock_ws2])
-        rws = ReconnectingWebSocket(connect_fn)
+        rws = ReconnectingWebSocket(connect_fn, on_connect=on_connect, retry_config=_ONE_SHOT_CFG)
+        if case.started:
+            await rws.start()
 
-        await rws.start()
         # Should not raise
         result = await rws.reconnect()
 
-        assert result is True
-        assert rws._connection is mock_ws2
+        assert result is case.expect_result
+        if not case.started:
+            assert connects == []
+            return
+        assert old_ws.close_called == 1
+        if case.expect_result:
+            assert rws.connection is new_ws
+            assert connects == [old_ws, new_ws]
+        else:
+            assert rws.connection is None
+            assert connects == [old_ws]
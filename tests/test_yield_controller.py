@@ -11,14 +11,27 @@ Tests cover:
 """
 
 import pytest
-from unittest.mock import MagicMock, patch
 
 from src.animation.yield_controller import (
+    LastFrame,
     YieldState,
     YieldController,
     create_yield_controller,
 )
-from src.audio.transport.audio_clock import get_audio_clock
+
+# One audio-clock session shared by every controller in this module
+SESSION_ID = "yield-test-module"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def audio_clock_session():
+    """Start the shared audio-clock session once for the whole module."""
+    from src.audio.transport.audio_clock import get_audio_clock
+
+    clock = get_audio_clock()
+    clock.start_session(SESSION_ID)
+    yield
+    clock.end_session(SESSION_ID)
 
 
 class TestYieldState:
@@ -42,40 +55,37 @@ class TestYieldState:
             frames_skipped=5,
             in_slow_freeze=True,
             freeze_progress=0.5,
-            last_valid_frame={"blendshapes": {}, "t_ms": 100},
+            last_valid_frame=LastFrame(blendshapes={}, t_ms=100),
         )
         assert state.is_yielding is True
         assert state.yield_start_ms == 1000
         assert state.frames_skipped == 5
         assert state.in_slow_freeze is True
         assert state.freeze_progress == 0.5
+        assert state.last_valid_frame.t_ms == 100
+
+    def test_slotted(self):
+        """State uses slots, so it has no per-instance __dict__."""
+        state = YieldState()
+        assert not hasattr(state, "__dict__")
+        with pytest.raises(AttributeError):
+            state.unknown_field = True
 
 
 class TestYieldController:
     """Tests for YieldController initialization."""
 
-    @pytest.fixture(autouse=True)
-    def setup_clock(self):
-        """Setup audio clock."""
-        clock = get_audio_clock()
-        clock.start_session("yield-test")
-        yield
-        try:
-            clock.end_session("yield-test")
-        except KeyError:
-            pass
-
     def test_init_default(self):
         """Initialize with defaults."""
-        controller = YieldController(session_id="yield-test")
-        assert controller._session_id == "yield-test"
+        controller = YieldController(session_id=SESSION_ID)
+        assert controller._session_id == SESSION_ID
         assert controller._yield_threshold_ms == 120  # TMF default
         assert controller._state.is_yielding is False
 
     def test_init_custom_thresholds(self):
         """Initialize with custom thresholds."""
         controller = YieldController(
-            session_id="yield-test",
+            session_id=SESSION_ID,
             yield_threshold_ms=100,
             freeze_trigger_ms=80,
             freeze_duration_ms=200,
@@ -88,21 +98,10 @@ class TestYieldController:
 class TestYieldControllerShouldYield:
     """Tests for should_yield behavior."""
 
-    @pytest.fixture(autouse=True)
-    def setup_clock(self):
-        """Setup audio clock."""
-        clock = get_audio_clock()
-        clock.start_session("should-yield-test")
-        yield
-        try:
-            clock.end_session("should-yield-test")
-        except KeyError:
-            pass
-
     def test_no_yield_below_threshold(self):
         """No yield when lag below threshold."""
         controller = YieldController(
-            session_id="should-yield-test",
+            session_id=SESSION_ID,
             yield_threshold_ms=120,
         )
 
@@ -114,7 +113,7 @@ class TestYieldControllerShouldYield:
     def test_yield_above_threshold(self):
         """Yield when lag above threshold."""
         controller = YieldController(
-            session_id="should-yield-test",
+            session_id=SESSION_ID,
             yield_threshold_ms=120,
         )
 
@@ -126,7 +125,7 @@ class TestYieldControllerShouldYield:
     def test_yield_ends_when_lag_drops(self):
         """Yield ends when lag drops below threshold."""
         controller = YieldController(
-            session_id="should-yield-test",
+            session_id=SESSION_ID,
             yield_threshold_ms=120,
         )
 
@@ -136,6 +135,106 @@ class TestYieldControllerShouldYield:
         controller.should_yield(50)  # Lag drops
         assert controller.is_yielding is False
 
+    def test_sustained_lag_starts_yield_once(self):
+        """Repeated frames above threshold do not restart the yield."""
+        controller = YieldController(
+            session_id=SESSION_ID,
+            yield_threshold_ms=120,
+        )
+        started = []
+        controller.on_yield_start(lambda: started.append(True))
+
+        results = [controller.should_yield(lag) for lag in (150, 160, 150, 50, 40, 150)]
+
+        assert results == [True, True, True, False, False, True]
+        assert len(started) == 2
+
+    def test_hysteresis_prevents_flapping(self):
+        """Lag hovering around the threshold does not toggle yield each frame."""
+        controller = YieldController(
+            session_id=SESSION_ID,
+            yield_threshold_ms=120,
+        )
+        started = []
+        controller.on_yield_start(lambda: started.append(True))
+
+        results = [controller.should_yield(lag) for lag in (130, 90, 125, 100, 130, 95)]
+
+        assert results == [True] * 6
+        assert len(started) == 1
+
+    def test_hysteresis_exit_threshold(self):
+        """Yield ends once lag drops to 70% of the threshold."""
+        controller = YieldController(
+            session_id=SESSION_ID,
+            yield_threshold_ms=120,
+        )
+
+        controller.should_yield(150)
+        assert controller.should_yield(85) is True
+        assert controller.should_yield(84) is False
+        # Re-entering needs the full threshold again
+        assert controller.should_yield(100) is False
+
+    def test_static_threshold_by_default(self):
+        """Without a target latency the threshold never moves."""
+        controller = YieldController(
+            session_id=SESSION_ID,
+            yield_threshold_ms=120,
+        )
+
+        for _ in range(50):
+            controller.should_yield(100)
+
+        assert controller._yield_threshold_ms == 120
+        assert controller.is_yielding is False
+
+    def test_adaptive_threshold_tracks_load(self):
+        """With a target latency, sustained overshoot lowers the threshold."""
+        controller = YieldController(
+            session_id=SESSION_ID,
+            target_latency_ms=120,
+        )
+
+        # Light load: threshold stays at the target, 110ms does not yield
+        for _ in range(50):
+            controller.should_yield(10)
+        assert controller._yield_threshold_ms == 120
+        assert controller.should_yield(110) is False
+
+        # Sustained overload: the threshold falls below the target
+        thresholds = []
+        for _ in range(50):
+            controller.should_yield(200)
+            thresholds.append(controller._yield_threshold_ms)
+        assert thresholds == sorted(thresholds, reverse=True)
+        assert controller._yield_threshold_ms < 110
+        assert controller.is_yielding is True
+
+    def test_adaptive_steady_lag_under_target_never_yields(self):
+        """Steady lag below the target never yields, however long it lasts."""
+        controller = YieldController(
+            session_id=SESSION_ID,
+            target_latency_ms=120,
+        )
+
+        assert not any(controller.should_yield(85) for _ in range(1000))
+        assert controller._yield_threshold_ms == 120
+
+    def test_adaptive_threshold_floor(self):
+        """The adaptive threshold never drops below the floor."""
+        from src.animation.yield_controller import MIN_ADAPTIVE_THRESHOLD_MS
+
+        controller = YieldController(
+            session_id=SESSION_ID,
+            target_latency_ms=120,
+        )
+
+        for _ in range(100):
+            controller.should_yield(1000)
+
+        assert controller._yield_threshold_ms == MIN_ADAPTIVE_THRESHOLD_MS
+
 
 class TestYieldControllerRecordFrame:
     """Tests for record_frame method."""
@@ -148,8 +247,8 @@ class TestYieldControllerRecordFrame:
         controller.record_frame(blendshapes, 1000)
 
         assert controller._state.last_valid_frame is not None
-        assert controller._state.last_valid_frame["blendshapes"] == blendshapes
-        assert controller._state.last_valid_frame["t_ms"] == 1000
+        assert controller._state.last_valid_frame.blendshapes == blendshapes
+        assert controller._state.last_valid_frame.t_ms == 1000
 
     def test_record_frame_copies_dict(self):
         """Record frame copies the blendshape dict."""
@@ -162,27 +261,28 @@ class TestYieldControllerRecordFrame:
         blendshapes["jawOpen"] = 1.0
 
         # Stored frame should be unchanged
-        assert controller._state.last_valid_frame["blendshapes"]["jawOpen"] == 0.5
+        assert controller._state.last_valid_frame.blendshapes["jawOpen"] == 0.5
+
+    def test_record_frame_reuses_holder(self):
+        """Subsequent frames update the same LastFrame in place."""
+        controller = YieldController(session_id="record-test")
+
+        controller.record_frame({"jawOpen": 0.5}, 1000)
+        holder = controller._state.last_valid_frame
+        controller.record_frame({"jawOpen": 0.7}, 1033)
+
+        assert controller._state.last_valid_frame is holder
+        assert holder.blendshapes == {"jawOpen": 0.7}
+        assert holder.t_ms == 1033
 
 
 class TestYieldControllerGetYieldPose:
     """Tests for get_yield_pose method."""
 
-    @pytest.fixture(autouse=True)
-    def setup_clock(self):
-        """Setup audio clock."""
-        clock = get_audio_clock()
-        clock.start_session("pose-test")
-        yield
-        try:
-            clock.end_session("pose-test")
-        except KeyError:
-            pass
-
     def test_get_yield_pose_returns_last_frame(self):
         """get_yield_pose returns last recorded frame."""
         controller = YieldController(
-            session_id="pose-test",
+            session_id=SESSION_ID,
             yield_threshold_ms=50,
             freeze_trigger_ms=1000,  # High to prevent freeze
         )
@@ -200,7 +300,7 @@ class TestYieldControllerGetYieldPose:
     def test_get_yield_pose_returns_neutral_without_last_frame(self):
         """get_yield_pose returns neutral if no last frame."""
         controller = YieldController(
-            session_id="pose-test",
+            session_id=SESSION_ID,
             yield_threshold_ms=50,
             freeze_trigger_ms=1000,
         )
@@ -217,7 +317,7 @@ class TestYieldControllerGetYieldPose:
     def test_get_yield_pose_increments_skipped(self):
         """get_yield_pose increments frames_skipped."""
         controller = YieldController(
-            session_id="pose-test",
+            session_id=SESSION_ID,
             yield_threshold_ms=50,
             freeze_trigger_ms=1000,
         )
@@ -231,24 +331,31 @@ class TestYieldControllerGetYieldPose:
         controller.get_yield_pose(1050)
         assert controller.frames_skipped == 2
 
+    def test_get_yield_pose_does_not_allocate_per_frame(self):
+        """Held and neutral yield frames return the same dict every call."""
+        controller = YieldController(
+            session_id=SESSION_ID,
+            yield_threshold_ms=50,
+            freeze_trigger_ms=1000,
+        )
+        controller.should_yield(100)
+
+        neutral = controller.get_yield_pose(1000)
+        assert controller.get_yield_pose(1033) is neutral
+
+        controller.record_frame({"jawOpen": 0.8}, 1066)
+        held = controller.get_yield_pose(1100)
+        assert controller.get_yield_pose(1133) is held
+        assert held == {"jawOpen": 0.8}
+        assert controller.frames_skipped == 4
+
 
 class TestYieldControllerSlowFreeze:
     """Tests for slow-freeze behavior."""
 
-    @pytest.fixture(autouse=True)
-    def setup_clock(self):
-        """Setup audio clock."""
-        clock = get_audio_clock()
-        clock.start_session("freeze-test")
-        yield
-        try:
-            clock.end_session("freeze-test")
-        except KeyError:
-            pass
-
     def test_slow_freeze_state_management(self):
         """Slow-freeze state can be set and checked."""
-        controller = YieldController(session_id="freeze-test")
+        controller = YieldController(session_id=SESSION_ID)
 
         # Initially not freezing
         assert controller.is_freezing is False
@@ -261,41 +368,24 @@ class TestYieldControllerSlowFreeze:
 class TestYieldControllerInterpolatePose:
     """Tests for pose interpolation during freeze."""
 
-    @pytest.fixture(autouse=True)
-    def setup_clock(self):
-        """Setup audio clock."""
-        clock = get_audio_clock()
-        clock.start_session("interp-test")
-        yield
-        try:
-            clock.end_session("interp-test")
-        except KeyError:
-            pass
-
     def test_interpolate_to_neutral_start(self):
         """Interpolation at progress 0 returns last pose."""
-        controller = YieldController(session_id="interp-test")
+        controller = YieldController(session_id=SESSION_ID)
 
         last_pose = {"jawOpen": 0.8, "mouthSmile_L": 0.5}
-        controller._state.last_valid_frame = {
-            "blendshapes": last_pose,
-            "t_ms": 1000,
-        }
+        controller.record_frame(last_pose, 1000)
 
         result = controller._interpolate_to_neutral(0.0)
 
-        # At progress 0, should be close to last pose
-        assert result["jawOpen"] == pytest.approx(0.8, abs=0.01)
+        # At progress 0 the eased weight is exactly 0.0, so the pose is exact
+        assert result["jawOpen"] == 0.8
 
     def test_interpolate_to_neutral_end(self):
         """Interpolation at progress 1 returns neutral."""
-        controller = YieldController(session_id="interp-test")
+        controller = YieldController(session_id=SESSION_ID)
 
         last_pose = {"jawOpen": 0.8, "mouthSmile_L": 0.5}
-        controller._state.last_valid_frame = {
-            "blendshapes": last_pose,
-            "t_ms": 1000,
-        }
+        controller.record_frame(last_pose, 1000)
 
         result = controller._interpolate_to_neutral(1.0)
 
@@ -304,13 +394,10 @@ class TestYieldControllerInterpolatePose:
 
     def test_interpolate_to_neutral_midpoint(self):
         """Interpolation at midpoint is between pose and neutral."""
-        controller = YieldController(session_id="interp-test")
+        controller = YieldController(session_id=SESSION_ID)
 
         last_pose = {"jawOpen": 1.0}
-        controller._state.last_valid_frame = {
-            "blendshapes": last_pose,
-            "t_ms": 1000,
-        }
+        controller.record_frame(last_pose, 1000)
 
         result = controller._interpolate_to_neutral(0.5)
 
@@ -319,9 +406,74 @@ class TestYieldControllerInterpolatePose:
         # So value = 1.0 + (0.0 - 1.0) * 0.75 = 0.25
         assert 0.0 < result["jawOpen"] < 1.0
 
+    def test_interpolate_matches_scalar_lerp(self):
+        """Vectorized interpolation matches the per-key ease-out lerp."""
+        from src.animation.base import ARKIT_52_BLENDSHAPES
+
+        controller = YieldController(session_id=SESSION_ID)
+        controller.set_neutral_pose(dict.fromkeys(ARKIT_52_BLENDSHAPES, 0.1))
+        last_pose = {k: i / 52 for i, k in enumerate(ARKIT_52_BLENDSHAPES[::2])}
+        controller.record_frame(last_pose, 1000)
+
+        result = controller._interpolate_to_neutral(0.3)
+
+        eased = 1.0 - (1.0 - 0.3) ** 2
+        assert list(result) == ARKIT_52_BLENDSHAPES
+        for key in ARKIT_52_BLENDSHAPES:
+            start = last_pose.get(key, 0.0)
+            # 8-bit progress keeps the curve within half a level (~0.4%)
+            assert result[key] == pytest.approx(start + (0.1 - start) * eased, abs=5e-3)
+
+    def test_ease_out_table(self):
+        """The precomputed ease-out table is exact at the ends and monotone."""
+        from src.animation.yield_controller import _EASE_OUT_LUT
+
+        assert _EASE_OUT_LUT[0] == 0.0
+        assert _EASE_OUT_LUT[-1] == 1.0
+        assert list(_EASE_OUT_LUT) == sorted(_EASE_OUT_LUT)
+        assert len(_EASE_OUT_LUT) == 256
+        assert _EASE_OUT_LUT[128] == pytest.approx(0.75, abs=5e-3)
+
+    def test_interpolate_follows_new_frames(self):
+        """Recording a new frame refreshes the cached pose vector."""
+        controller = YieldController(session_id=SESSION_ID)
+
+        controller.record_frame({"jawOpen": 1.0}, 1000)
+        assert controller._interpolate_to_neutral(0.0)["jawOpen"] == 1.0
+
+        controller.record_frame({"jawOpen": 0.4}, 1033)
+        assert controller._interpolate_to_neutral(0.0)["jawOpen"] == 0.4
+
+    def test_interpolate_reuses_pose_within_level(self):
+        """Repeated frames at the same progress return the cached pose."""
+        controller = YieldController(session_id=SESSION_ID)
+        controller.record_frame({"jawOpen": 1.0}, 1000)
+
+        frozen = controller._interpolate_to_neutral(1.0)
+        assert controller._interpolate_to_neutral(1.0) is frozen
+
+        midway = controller._interpolate_to_neutral(0.5)
+        assert midway is not frozen
+        assert controller._interpolate_to_neutral(0.5 + 1 / 1024) is midway
+
+    def test_pose_cache_invalidated(self):
+        """New frames, neutral poses and reset() drop the cached pose."""
+        controller = YieldController(session_id=SESSION_ID)
+        controller.record_frame({"jawOpen": 1.0}, 1000)
+        assert controller._interpolate_to_neutral(0.0)["jawOpen"] == 1.0
+
+        controller.record_frame({"jawOpen": 0.4}, 1033)
+        assert controller._interpolate_to_neutral(0.0)["jawOpen"] == 0.4
+
+        controller.set_neutral_pose({"jawOpen": 0.2})
+        assert controller._interpolate_to_neutral(1.0)["jawOpen"] == 0.2
+
+        controller.reset()
+        assert controller._pose_cache is None
+
     def test_interpolate_without_last_frame(self):
         """Interpolation without last frame returns neutral."""
-        controller = YieldController(session_id="interp-test")
+        controller = YieldController(session_id=SESSION_ID)
 
         result = controller._interpolate_to_neutral(0.5)
 
@@ -331,21 +483,10 @@ class TestYieldControllerInterpolatePose:
 class TestYieldControllerCallbacks:
     """Tests for yield callbacks."""
 
-    @pytest.fixture(autouse=True)
-    def setup_clock(self):
-        """Setup audio clock."""
-        clock = get_audio_clock()
-        clock.start_session("callback-test")
-        yield
-        try:
-            clock.end_session("callback-test")
-        except KeyError:
-            pass
-
     def test_on_yield_start_callback(self):
         """on_yield_start callback is called."""
         controller = YieldController(
-            session_id="callback-test",
+            session_id=SESSION_ID,
             yield_threshold_ms=50,
         )
 
@@ -359,9 +500,22 @@ class TestYieldControllerCallbacks:
 
         assert len(yield_started) == 1
 
+    def test_callbacks_default_to_noop(self):
+        """Unregistered callbacks are no-ops, so edges need no None checks."""
+        controller = YieldController(
+            session_id=SESSION_ID,
+            yield_threshold_ms=50,
+            freeze_trigger_ms=0,
+        )
+
+        assert controller.should_yield(100) is True
+        controller.get_yield_pose(1000)
+
+        assert controller.is_freezing is True
+
     def test_on_slow_freeze_callback_registered(self):
         """on_slow_freeze callback is registered."""
-        controller = YieldController(session_id="callback-test")
+        controller = YieldController(session_id=SESSION_ID)
 
         freeze_started = []
 
@@ -449,6 +603,29 @@ class TestYieldControllerNeutralPose:
         # Stored neutral should be unchanged
         assert controller._neutral_pose["jawOpen"] == 0.1
 
+    def test_neutral_pose_read_only(self):
+        """The stored neutral is a read-only view handed out without copying."""
+        controller = YieldController(session_id="neutral-test")
+        controller.set_neutral_pose({"jawOpen": 0.1})
+
+        neutral = controller.neutral_pose
+        assert neutral is controller.neutral_pose
+        with pytest.raises(TypeError):
+            neutral["jawOpen"] = 0.9
+
+        # Poses handed to callers are still plain dicts
+        pose = controller._get_neutral()
+        assert type(pose) is dict
+        assert pose == {"jawOpen": 0.1}
+
+    def test_neutral_pose_default(self):
+        """neutral_pose loads the default ARKit neutral on first use."""
+        from src.animation.base import get_neutral_blendshapes
+
+        controller = YieldController(session_id="neutral-test")
+
+        assert controller.neutral_pose == get_neutral_blendshapes()
+
 
 class TestCreateYieldController:
     """Tests for factory function."""
@@ -459,3 +636,11 @@ class TestCreateYieldController:
 
         assert isinstance(controller, YieldController)
         assert controller._session_id == "factory-test"
+        assert controller._target_latency_ms is None
+
+    def test_factory_passes_target_latency(self):
+        """Factory opts into the adaptive threshold when given a target."""
+        controller = create_yield_controller("factory-test", target_latency_ms=150)
+
+        assert controller._target_latency_ms == 150
+        assert controller._yield_threshold_ms == 150